@@ -63,6 +63,8 @@ class VHACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
 
     def cancel(self, context):
         context.space_data.shading.color_type = self.color_type
+        self.remove_regeneration_timer(context)
+        self.remove_collider_pool()
         try:
             bpy.types.SpaceView3D.draw_handler_remove(self._handle, 'WINDOW')
         except ValueError:
@@ -97,8 +99,6 @@ class VHACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
         objs = self.get_pre_processed_mesh_objs(context, default_world_spc=True)
 
         for base_ob, obj in objs:
-            context.view_layer.objects.active = obj
-
             if self.obj_mode == "EDIT" and base_ob.type == 'MESH' and self.active_obj.type == 'MESH' and not self.use_loose_mesh:
                 new_mesh = self.get_mesh_Edit(
                     obj, use_modifiers=self.my_use_modifier_stack)
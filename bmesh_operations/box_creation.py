@@ -1,19 +1,67 @@
-import bmesh
 import bpy
+import numpy as np
 
 from bpy_extras.object_utils import object_data_add
 
 tmp_name = 'box_collider'
 
 # vertex indices defining the faces of the cube
-face_order = [
+face_order = (
     (0, 1, 2, 3),
     (4, 7, 6, 5),
     (0, 4, 5, 1),
     (1, 5, 6, 2),
     (2, 6, 7, 3),
     (4, 0, 3, 7),
-]
+)
+
+# face order used by add_box_object
+box_object_faces = ((0, 1, 2, 3), (7, 6, 5, 4), (5, 6, 2, 1), (0, 3, 7, 4), (3, 2, 6, 7), (4, 5, 1, 0))
+
+
+def flatten_quads(faces):
+    """Return the loop vertex indices of quad faces as read-only flat array."""
+    indices = np.array(faces, dtype=np.int32).ravel()
+    indices.flags.writeable = False
+    return indices
+
+
+# flattened loop data of the cube faces, the same for every box
+loop_vertex_indices = flatten_quads(face_order)
+box_object_loop_vertex_indices = flatten_quads(box_object_faces)
+loop_starts = np.arange(0, loop_vertex_indices.size, 4, dtype=np.int32)
+loop_starts.flags.writeable = False
+
+
+def box_mesh_from_verts(name, verts_loc, loop_indices):
+    """
+    Create a box mesh from its 8 vertices without going through bmesh or from_pydata.
+
+    Parameters:
+    name (str): The name of the new mesh.
+    verts_loc (numpy.ndarray or list of tuple of float): The (8, 3) vertex coordinates of the box.
+    loop_indices (numpy.ndarray): The flattened vertex indices of the 6 quad faces.
+
+    Returns:
+    bpy.types.Mesh: The newly created mesh.
+    """
+
+    mesh = bpy.data.meshes.new(name)
+
+    # create mesh vertices
+    mesh.vertices.add(len(verts_loc))
+    mesh.vertices.foreach_set('co', np.asarray(verts_loc, dtype=np.float32).ravel())
+
+    # connect vertices to faces
+    mesh.loops.add(loop_indices.size)
+    mesh.loops.foreach_set('vertex_index', loop_indices)
+    mesh.polygons.add(len(loop_starts))
+    mesh.polygons.foreach_set('loop_start', loop_starts)
+
+    # update mesh to draw properly in viewport
+    mesh.update(calc_edges=True)
+
+    return mesh
 
 
 def add_box_object(context, vertices):
@@ -30,12 +78,7 @@ def add_box_object(context, vertices):
 
     global tmp_name
 
-    verts = vertices
-    edges = []
-    faces = [[0, 1, 2, 3], [7, 6, 5, 4], [5, 6, 2, 1], [0, 3, 7, 4], [3, 2, 6, 7], [4, 5, 1, 0]]
-
-    mesh = bpy.data.meshes.new(name=tmp_name)
-    mesh.from_pydata(verts, edges, faces)
+    mesh = box_mesh_from_verts(tmp_name, vertices, box_object_loop_vertex_indices)
 
     return object_data_add(context, mesh, operator=None, name=None)
 
@@ -47,7 +90,7 @@ def verts_faces_to_bbox_collider(self, context, verts_loc):
     Parameters:
     self (object): Reference to the operator or class instance calling this method.
     context (bpy.types.Context): The Blender context in which to create the collider.
-    verts_loc (list of tuple of float): A list of tuples representing the vertex coordinates.
+    verts_loc (numpy.ndarray or list of tuple of float): The (8, 3) vertex coordinates of the box.
 
     Returns:
     bpy.types.Object: The newly created collider object.
@@ -56,24 +99,10 @@ def verts_faces_to_bbox_collider(self, context, verts_loc):
     global tmp_name
 
     # add new mesh
-    mesh = bpy.data.meshes.new(tmp_name)
-    bm = bmesh.new()
-
-    # create mesh vertices
-    for v_co in verts_loc:
-        bm.verts.new(v_co)
-
-    # connect vertices to faces
-    bm.verts.ensure_lookup_table()
-    for f_idx in face_order:
-        bm.faces.new([bm.verts[i] for i in f_idx])
-
-    # update bmesh to draw properly in viewport
-    bm.to_mesh(mesh)
-    mesh.update()
+    mesh = box_mesh_from_verts(tmp_name, verts_loc, loop_vertex_indices)
 
     # create new object from mesh and link it to collection
-    new_collider = bpy.data.objects.new(tmp_name, mesh)
+    new_collider = self.new_collider_object(tmp_name, mesh)
 
     root_collection = context.scene.collection
     root_collection.objects.link(new_collider)
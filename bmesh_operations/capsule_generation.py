@@ -1,5 +1,6 @@
+import functools
 import math
-import bmesh
+import bpy
 import numpy as np
 from mathutils import Vector, Matrix
 
@@ -11,7 +12,7 @@ def calculate_radius_height(points, cylinder_axis='Z'):
     Calculate the radius, height, center, and rotation matrix of a capsule that fits the given points.
 
     Parameters:
-    points (list of float): A list of 3D points that define the capsule.
+    points (numpy.ndarray or list of float): An (N, 3) array or list of 3D points that define the capsule.
     cylinder_axis (str): The axis ('X', 'Y', 'Z') along which the capsule is oriented.
 
     Returns:
@@ -28,13 +29,21 @@ def calculate_radius_height(points, cylinder_axis='Z'):
     if len(points) < 2:
         raise ValueError("At least two points are required to define a capsule")
 
-    # Convert points to numpy array
-    np_points = np.array(points)
+    # Convert points to numpy array. This does not copy if the points already are a float64 array.
+    np_points = np.asarray(points, dtype=np.float64)
 
-    # Perform Singular Value Decomposition (SVD) to find the principal axis
+    # The principal axis is the eigenvector of the 3x3 covariance matrix with the largest eigenvalue.
+    # This is equivalent to the first right singular vector of the centered points but avoids a full SVD.
     centered_points = np_points - np_points.mean(axis=0)
-    u, s, vh = np.linalg.svd(centered_points)
-    principal_axis = vh[0]
+    if len(np_points) == 2:
+        # The principal axis of two points is their normalized difference.
+        difference = np_points[1] - np_points[0]
+        length = math.sqrt(difference.dot(difference))
+        principal_axis = difference / length if length > 0.0 else np.array((0.0, 0.0, 1.0))
+    else:
+        covariance = centered_points.T @ centered_points
+        eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+        principal_axis = eigenvectors[:, -1]
 
     # Project points onto the principal axis
     projections = np_points.dot(principal_axis)
@@ -48,40 +57,36 @@ def calculate_radius_height(points, cylinder_axis='Z'):
     center_along_axis = (min_projection + max_projection) / 2.0
     capsule_center = np_points.mean(axis=0) + principal_axis * center_along_axis
 
-    # Calculate the radius as the maximum distance from the points to the principal axis
-    def distance_to_axis(point, axis_point, axis_dir):
-        v = point - axis_point
-        d = v - np.dot(v, axis_dir) * axis_dir
-        return np.linalg.norm(d)
+    # Calculate the radius as the maximum distance from the points to the principal axis.
+    # The squared distance to the axis is |v|^2 - (v . axis)^2 for every centered point v.
+    axial = centered_points @ principal_axis
+    perp_sq = np.einsum('ij,ij->i', centered_points, centered_points) - axial * axial
+    radius = float(np.sqrt(max(perp_sq.max(), 0.0)))
 
-    axis_point = np_points.mean(axis=0)
-    radius = max(distance_to_axis(p, axis_point, principal_axis) for p in np_points)
-
-    # Calculate rotation matrix to align the principal axis with the selected cylinder axis
+    # Calculate rotation matrix to align the principal axis with the selected cylinder axis.
+    # mathutils is used for the 3-vector math as NumPy's call overhead dominates for such small arrays.
+    axis = Vector(principal_axis)
     if cylinder_axis == 'X':
-        x_axis = principal_axis
-        y_axis = np.cross([0, 0, 1], x_axis)
-        z_axis = np.cross(x_axis, y_axis)
+        x_axis = axis
+        y_axis = Vector((0, 0, 1)).cross(x_axis)
+        z_axis = x_axis.cross(y_axis)
     elif cylinder_axis == 'Y':
-        y_axis = principal_axis
-        x_axis = np.cross([0, 0, 1], y_axis)
-        z_axis = np.cross(x_axis, y_axis)
+        y_axis = axis
+        x_axis = Vector((0, 0, 1)).cross(y_axis)
+        z_axis = x_axis.cross(y_axis)
     else:  # default is 'Z'
-        z_axis = principal_axis
-        x_axis = np.cross([0, 1, 0], z_axis)
-        y_axis = np.cross(z_axis, x_axis)
-
-    if np.linalg.norm(y_axis) < 1e-6:
-        y_axis = np.cross([0, 1, 0], z_axis)
-    x_axis /= np.linalg.norm(x_axis)
-    y_axis /= np.linalg.norm(y_axis)
-    z_axis /= np.linalg.norm(z_axis)
-
-    rotation_matrix_3x3 = Matrix([
-        [x_axis[0], y_axis[0], z_axis[0]],
-        [x_axis[1], y_axis[1], z_axis[1]],
-        [x_axis[2], y_axis[2], z_axis[2]]
-    ])
+        z_axis = axis
+        x_axis = Vector((0, 1, 0)).cross(z_axis)
+        y_axis = z_axis.cross(x_axis)
+
+    if y_axis.length < 1e-6:
+        y_axis = Vector((0, 1, 0)).cross(z_axis)
+    x_axis.normalize()
+    y_axis.normalize()
+    z_axis.normalize()
+
+    # The axes are the columns of the rotation matrix
+    rotation_matrix_3x3 = Matrix((x_axis, y_axis, z_axis)).transposed()
 
     # Convert center back to Vector for Blender
     center_vector = Vector(capsule_center)
@@ -91,65 +96,66 @@ def calculate_radius_height(points, cylinder_axis='Z'):
     return radius, height, center_vector, rotation_matrix_4x4
 
 
-@staticmethod
-def mesh_data_to_bmesh(
-        vs, vts, vns,
-        v_indices, vt_indices, vn_indices):
-    bm = bmesh.new()
+def mesh_data_to_mesh(name, vs, vts, v_indices, vt_indices):
     """
-    Convert mesh data into a Blender BMesh.
+    Convert mesh data into a Blender Mesh by uploading the buffers in bulk.
 
     Parameters:
-    vs (list of tuple of float): List of vertex coordinates.
-    vts (list of tuple of float): List of texture coordinates.
-    vns (list of tuple of float): List of normal vectors.
-    v_indices (list of tuple of int): List of vertex indices for each face.
-    vt_indices (list of tuple of int): List of texture coordinate indices for each face.
-    vn_indices (list of tuple of int): List of normal indices for each face.
+    name (str): Name of the new mesh data-block.
+    vs (numpy.ndarray): Vertex coordinates.
+    vts (numpy.ndarray): Texture coordinates.
+    v_indices (numpy.ndarray): Vertex indices for each face. Triangles are padded with -1.
+    vt_indices (numpy.ndarray): Texture coordinate indices for each face.
 
     Returns:
-    bmesh.types.BMesh: A BMesh object containing the mesh data.
-
+    bpy.types.Mesh: A Mesh containing the mesh data. Normals are derived by Blender from the faces.
     """
 
-    # Create BM vertices.
-    len_vs = len(vs)
-    bm_verts = [None] * len_vs
-    for i in range(0, len_vs):
-        v = vs[i]
-        bm_verts[i] = bm.verts.new(v)
+    # Faces are stored row by row, so masking the padding keeps the loop order of the mesh.
+    loop_mask = v_indices >= 0
+    loop_totals = loop_mask.sum(axis=1)
+    loop_starts = np.zeros(len(v_indices), dtype=np.int32)
+    np.cumsum(loop_totals[:-1], out=loop_starts[1:])
 
-    # Create BM faces.
-    len_v_indices = len(v_indices)
-    bm_faces = [None] * len_v_indices
-    uv_layer = bm.loops.layers.uv.verify()
+    mesh = bpy.data.meshes.new(name)
 
-    for i in range(0, len_v_indices):
-        v_loop = v_indices[i]
-        vt_loop = vt_indices[i]
-        vn_loop = vn_indices[i]
+    # foreach_set copies contiguous float32 and int32 buffers directly.
+    mesh.vertices.add(len(vs))
+    mesh.vertices.foreach_set('co', vs.astype(np.float32, copy=False).ravel())
 
-        # Find list of vertices per face.
-        len_v_loop = len(v_loop)
-        face_verts = [None] * len_v_loop
-        for j in range(0, len_v_loop):
-            face_verts[j] = bm_verts[v_loop[j]]
+    mesh.loops.add(int(loop_totals.sum()))
+    mesh.loops.foreach_set('vertex_index', v_indices[loop_mask].astype(np.int32, copy=False))
 
-        # Create BM face.
-        bm_face = bm.faces.new(face_verts)
-        bm_faces[i] = bm_face
-        bm_face_loops = list(bm_face.loops)
+    mesh.polygons.add(len(v_indices))
+    mesh.polygons.foreach_set('loop_start', loop_starts)
 
-        # Assign texture coordinates and normals.
-        for k in range(0, len_v_loop):
-            bm_face_loop = bm_face_loops[k]
-            bm_face_loop[uv_layer].uv = vts[vt_loop[k]]
-            bm_face_loop.vert.normal = vns[vn_loop[k]]
+    uv_layer = mesh.uv_layers.new()
+    uv_layer.data.foreach_set('uv', vts[vt_indices[loop_mask]].astype(np.float32, copy=False).ravel())
 
-    return bm
+    mesh.update(calc_edges=True)
+    return mesh
+
+
+def _quad_strip_indices(row_starts, row_stride, cols, cols_next):
+    """
+    Build the quad indices connecting consecutive rows of a grid.
+
+    Parameters:
+    row_starts (numpy.ndarray): Index of the first element of every row.
+    row_stride (int): Index offset from one row to the next.
+    cols (numpy.ndarray): Column offsets of the current quad corners.
+    cols_next (numpy.ndarray): Column offsets of the next quad corners (wrapped or not).
+
+    Returns:
+    numpy.ndarray: An (len(row_starts) * len(cols), 4) array of quad indices.
+    """
+    curr_row = row_starts[:, None]
+    next_row = curr_row + row_stride
+    quads = np.stack(np.broadcast_arrays(curr_row + cols, next_row + cols, next_row + cols_next, curr_row + cols_next),
+                     axis=-1)
+    return quads.reshape(-1, 4)
 
 
-@staticmethod
 def create_capsule_data(longitudes=32, latitudes=16, rings=0, depth=1.0, radius=0.5, uv_profile="FIXED"):
     """
     Create a capsule mesh data.
@@ -178,6 +184,48 @@ def create_capsule_data(longitudes=32, latitudes=16, rings=0, depth=1.0, radius=
     if (verif_lats % 2) != 0:
         verif_lats += 1
 
+    # Aspect ratio.
+    vt_aspect_south = 1.0 / 3.0
+    if uv_profile == "ASPECT":
+        vt_aspect_south = (verif_rad / (verif_depth + 2.0 * verif_rad))
+    elif uv_profile == "UNIFORM":
+        vt_aspect_south = (verif_lats // 2) / (verif_rings + 1 + verif_lats)
+
+    # The capsule only differs from the cached unit capsule by a uniform scale of
+    # the hemispheres and an offset of every vertex along z, so only the
+    # coordinates have to be recomputed.
+    unit_vs, z_facs, vts, vns, v_indices, vt_indices, vn_indices = _create_capsule_unit(
+        verif_lons, verif_lats, verif_rings, vt_aspect_south)
+
+    vs = unit_vs * verif_rad
+    vs[:, 2] += z_facs * (verif_depth * 0.5)
+
+    # Return a dictionary containing data.
+    return {"vs": vs,
+            "vts": vts,
+            "vns": vns,
+            "v_indices": v_indices,
+            "vt_indices": vt_indices,
+            "vn_indices": vn_indices}
+
+
+@functools.lru_cache(maxsize=8)
+def _create_capsule_unit(verif_lons, verif_lats, verif_rings, vt_aspect_south):
+    """
+    Create the mesh data of a capsule with a radius of 1.0 and a depth of 0.0.
+
+    Parameters:
+    verif_lons (int): Number of longitudinal segments.
+    verif_lats (int): Even number of latitudinal segments.
+    verif_rings (int): Number of ring segments in the middle section of the capsule.
+    vt_aspect_south (float): Vertical texture coordinate of the South equator.
+
+    Returns:
+    tuple: The unit vertices, the z offset factor of every vertex (1.0 at the North equator, -1.0 at
+           the South equator), texture coordinates, normals, vertex indices, texture coordinate indices
+           and normal indices. The arrays are cached and therefore read-only.
+    """
+
     # Preliminary calculations.
     calc_middle = verif_rings > 0
     half_lats = verif_lats // 2
@@ -187,8 +235,6 @@ def create_capsule_data(longitudes=32, latitudes=16, rings=0, depth=1.0, radius=
     verif_lons_p1 = verif_lons + 1
     v_lons_half_lat_n1 = half_lats_n1 * verif_lons
     v_lons_v_sections_p1 = verif_rings_p1 * verif_lons
-    half_depth = verif_depth * 0.5
-    summit = half_depth + verif_rad
 
     # Coordinate index offsets.
     idx_v_n_equator = verif_lons_p1 + verif_lons * half_lats_n2
@@ -225,24 +271,26 @@ def create_capsule_data(longitudes=32, latitudes=16, rings=0, depth=1.0, radius=
     len_indices = idx_fs_south_hemi + verif_lons
 
     # Allocate mesh data.
-    vs = [(0.0, 0.0, 0.0)] * len_vs
-    vts = [(0.5, 0.5)] * len_vts
-    vns = [(0.0, 0.0, 1.0)] * len_vns
-
-    # Allocate indices arrays. (When properly filled, index tuples at the
-    # poles will be of length 3, else of length 4.)
-    v_indices = [(0, 0, 0)] * len_indices
-    vt_indices = [(0, 0, 0)] * len_indices
-    vn_indices = [(0, 0, 0)] * len_indices
-
-    # Ranges for loops.
-    lons_range = range(0, verif_lons)
-    lons_p1_range = range(0, verif_lons_p1)
-    hemi_range = range(0, half_lats_n1)
+    vs = np.zeros((len_vs, 3))
+    vts = np.full((len_vts, 2), 0.5)
+    vns = np.zeros((len_vns, 3))
+    vns[:, 2] = 1.0
+
+    # Allocate indices arrays. Every face is stored as a row of 4 indices.
+    # The triangles at the poles only use 3 of them and are padded with -1.
+    v_indices = np.full((len_indices, 4), -1, dtype=np.int32)
+    vt_indices = np.full((len_indices, 4), -1, dtype=np.int32)
+    vn_indices = np.full((len_indices, 4), -1, dtype=np.int32)
+
+    # Every vertex of the North hemisphere is offset by half the depth, every
+    # vertex of the South hemisphere by minus half the depth.
+    z_facs = np.zeros(len_vs)
+    z_facs[:idx_v_cyl] = 1.0
+    z_facs[idx_v_s_equator:] = -1.0
 
     # Set poles.
-    vs[0] = (0.0, 0.0, summit)
-    vs[idx_v_south_pole] = (0.0, 0.0, -summit)
+    vs[0] = (0.0, 0.0, 1.0)
+    vs[idx_v_south_pole] = (0.0, 0.0, -1.0)
 
     vns[0] = (0.0, 0.0, 1.0)
     vns[idx_vn_south_pole] = (0.0, 0.0, -1.0)
@@ -250,308 +298,157 @@ def create_capsule_data(longitudes=32, latitudes=16, rings=0, depth=1.0, radius=
     # Calculate polar texture coordinates. UVs form a triangle at the poles,
     # where the polar vertex is centered between the other two vertices.
     # That is why j is offset by 0.5 . There is one fewer column of UVs at
-    # the poles, so the for loop uses the coordinate longitude range.
+    # the poles, so they use the coordinate longitude range.
     to_theta = math.tau / verif_lons
     to_phi = math.pi / verif_lats
     to_tex_horizontal = 1.0 / verif_lons
     to_tex_vertical = 1.0 / half_lats
-    sin_cos_theta_cache = [(0.0, 1.0)] * verif_lons
-
-    for j in lons_range:
-        j_next_vt = j + 1
-        j_next_v = j_next_vt % verif_lons
-
-        # Polar to Cartesian coordinates.
-        theta = j * to_theta
-        sin_theta = math.sin(theta)
-        cos_theta = math.cos(theta)
-        sin_cos_theta_cache[j] = (sin_theta, cos_theta)
-
-        # Texture coordinates at North and South poles.
-        s_tex = (j + 0.5) * to_tex_horizontal
-        vts[j] = (s_tex, 1.0)
-        vts[idx_vt_s_cap + j] = (s_tex, 0.0)
-
-        # Multiply by radius to get equatorial x and y.
-        x = verif_rad * cos_theta
-        y = verif_rad * sin_theta
-
-        # Equatorial coordinates.
-        vs[idx_v_n_equator + j] = (x, y, half_depth)
-        vs[idx_v_s_equator + j] = (x, y, -half_depth)
-
-        # Equatorial normals.
-        vns[idx_v_n_equator + j] = (cos_theta, sin_theta, 0.0)
-
-        # North triangle fan.
-        v_indices[j] = (0, j_next_vt, 1 + j_next_v)
-        vt_indices[j] = (j, verif_lons + j, verif_lons + j_next_vt)
-        vn_indices[j] = (0, j_next_vt, 1 + j_next_v)
-
-        # South triangle fan.
-        v_indices[idx_fs_south_hemi + j] = (
-            idx_v_south_pole,
-            idx_v_south_cap + j_next_v,
-            idx_v_south_cap + j)
-
-        vt_indices[idx_fs_south_hemi + j] = (
-            idx_vt_s_cap + j,
-            idx_vt_s_polar + j_next_vt,
-            idx_vt_s_polar + j)
-
-        vn_indices[idx_fs_south_hemi + j] = (
-            idx_vn_south_pole,
-            idx_vn_south_cap + j_next_v,
-            idx_vn_south_cap + j)
+
+    # Polar to Cartesian coordinates of every longitude.
+    thetas = np.arange(verif_lons) * to_theta
+    sin_thetas = np.sin(thetas)
+    cos_thetas = np.cos(thetas)
+
+    # Texture coordinates at North and South poles.
+    s_tex_polar = (np.arange(verif_lons) + 0.5) * to_tex_horizontal
+    vts[:verif_lons, 0] = s_tex_polar
+    vts[:verif_lons, 1] = 1.0
+    vts[idx_vt_s_cap:, 0] = s_tex_polar
+    vts[idx_vt_s_cap:, 1] = 0.0
+
+    # Equatorial coordinates.
+    equator = np.stack((cos_thetas, sin_thetas, np.zeros(verif_lons)), axis=-1)
+    vs[idx_v_n_equator:idx_v_cyl] = equator
+    vs[idx_v_s_equator:idx_v_south] = equator
+
+    # Equatorial normals.
+    vns[idx_v_n_equator:idx_vn_south] = equator
 
     # Calculate equatorial texture coordinates. Cache horizontal measure.
-    s_tex_cache = [0.5] * verif_lons_p1
+    s_tex_cache = np.arange(verif_lons_p1) * to_tex_horizontal
 
     # Aspect ratio.
-    vt_aspect_south = 1.0 / 3.0
-    if uv_profile == "ASPECT":
-        vt_aspect_south = (verif_rad / (verif_depth + 2.0 * verif_rad))
-    elif uv_profile == "UNIFORM":
-        vt_aspect_south = half_lats / (verif_rings_p1 + verif_lats)
     vt_aspect_north = 1.0 - vt_aspect_south
 
-    for j in lons_p1_range:
-        s_tex = j * to_tex_horizontal
-        s_tex_cache[j] = s_tex
-        vts[idx_vt_n_equator + j] = (s_tex, vt_aspect_north)
-        vts[idx_vt_s_equator + j] = (s_tex, vt_aspect_south)
+    vts[idx_vt_n_equator:idx_vt_cyl, 0] = s_tex_cache
+    vts[idx_vt_n_equator:idx_vt_cyl, 1] = vt_aspect_north
+    vts[idx_vt_s_equator:idx_vt_s_hemi, 0] = s_tex_cache
+    vts[idx_vt_s_equator:idx_vt_s_hemi, 1] = vt_aspect_south
 
     # Divide latitudes into hemispheres. Start at i = 1 due to the poles.
-    v_hemi_offset_north = 1
-    v_hemi_offset_south = idx_v_south
-
-    vt_hemi_offset_north = verif_lons
-    vt_hemi_offset_south = idx_vt_s_hemi
-
-    vn_hemi_offset_south = idx_vn_south
-
-    f_hemi_offset_north = verif_lons
-    f_hemi_offset_south = idx_fs_south_equat
-
-    for i in hemi_range:
-        ip1 = i + 1.0
-        phi = ip1 * to_phi
-        i_v_lons = i * verif_lons
-
-        # Symmetries mean cos and sin only need to be called once.
-        sin_phi_south = math.sin(phi)
-        cos_phi_south = math.cos(phi)
-        sin_phi_north = -cos_phi_south
-        cos_phi_north = sin_phi_south
-
-        # North coordinates: multiply by radius and offset.
-        rho_cos_phi_north = verif_rad * cos_phi_north
-        rho_sin_phi_north = verif_rad * sin_phi_north
-        offset_z_north = half_depth - rho_sin_phi_north
-
-        # South coordinates: multiply by radius and offset.
-        rho_cos_phi_south = verif_rad * cos_phi_south
-        rho_sin_phi_south = verif_rad * sin_phi_south
-        offset_z_south = -half_depth - rho_sin_phi_south
-
-        # North coordinate index offset.
-        v_curr_lat_n = 1 + i_v_lons
-        v_next_lat_n = v_curr_lat_n + verif_lons
-
-        # North texture coordinate index offset.
-        vt_curr_lat_n = verif_lons + i * verif_lons_p1
-        vt_next_lat_n = vt_curr_lat_n + verif_lons_p1
-
-        # North normal index offset.
-        vn_curr_lat_n = 1 + i_v_lons
-        vn_next_lat_n = vn_curr_lat_n + verif_lons
-
-        # South coordinate index offset.
-        v_curr_lat_s = idx_v_s_equator + i_v_lons
-        v_next_lat_s = v_curr_lat_s + verif_lons
-
-        # South texture coordinate index offset.
-        vt_curr_lat_s = idx_vt_s_equator + i * verif_lons_p1
-        vt_next_lat_s = vt_curr_lat_s + verif_lons_p1
-
-        # South normal index offset.
-        vn_curr_lat_s = idx_v_n_equator + i_v_lons
-        vn_next_lat_s = vn_curr_lat_s + verif_lons
-
-        # Coordinates & normals.
-        for j in lons_range:
-            j_next_vt = j + 1
-            j_next_v = j_next_vt % verif_lons
-            sin_theta, cos_theta = sin_cos_theta_cache[j]
-
-            # North coordinate.
-            vs[v_hemi_offset_north] = (
-                rho_cos_phi_north * cos_theta,
-                rho_cos_phi_north * sin_theta,
-                offset_z_north)
-
-            # South coordinate.
-            vs[v_hemi_offset_south] = (
-                rho_cos_phi_south * cos_theta,
-                rho_cos_phi_south * sin_theta,
-                offset_z_south)
-
-            # North normal.
-            vns[v_hemi_offset_north] = (
-                cos_phi_north * cos_theta,
-                cos_phi_north * sin_theta,
-                -sin_phi_north)
-
-            # South normal.
-            vns[vn_hemi_offset_south] = (
-                cos_phi_south * cos_theta,
-                cos_phi_south * sin_theta,
-                -sin_phi_south)
-
-            # Update vertex offsets.
-            v_hemi_offset_north += 1
-            v_hemi_offset_south += 1
-            vn_hemi_offset_south += 1
-
-            # Coordinates North quad.
-            v_indices[f_hemi_offset_north] = (
-                v_curr_lat_n + j,
-                v_next_lat_n + j,
-                v_next_lat_n + j_next_v,
-                v_curr_lat_n + j_next_v)
-
-            # Texture coordinates North quad.
-            vt_indices[f_hemi_offset_north] = (
-                vt_curr_lat_n + j,
-                vt_next_lat_n + j,
-                vt_next_lat_n + j_next_vt,
-                vt_curr_lat_n + j_next_vt)
-
-            # Normals North quad.
-            vn_indices[f_hemi_offset_north] = (
-                vn_curr_lat_n + j,
-                vn_next_lat_n + j,
-                vn_next_lat_n + j_next_v,
-                vn_curr_lat_n + j_next_v)
-
-            # Coordinates South quad.
-            v_indices[f_hemi_offset_south] = (
-                v_curr_lat_s + j,
-                v_next_lat_s + j,
-                v_next_lat_s + j_next_v,
-                v_curr_lat_s + j_next_v)
-
-            # Texture coordinates South quad.
-            vt_indices[f_hemi_offset_south] = (
-                vt_curr_lat_s + j,
-                vt_next_lat_s + j,
-                vt_next_lat_s + j_next_vt,
-                vt_curr_lat_s + j_next_vt)
-
-            # Normals South quad.
-            vn_indices[f_hemi_offset_south] = (
-                vn_curr_lat_s + j,
-                vn_next_lat_s + j,
-                vn_next_lat_s + j_next_v,
-                vn_curr_lat_s + j_next_v)
-
-            # Update face index offsets.
-            f_hemi_offset_north += 1
-            f_hemi_offset_south += 1
-
-        # Find vertical component of texture.
-        t_tex_fac = ip1 * to_tex_vertical
-        t_tex_north = 1.0 * (1.0 - t_tex_fac) + t_tex_fac * vt_aspect_north
-        t_tex_south = vt_aspect_south * (1.0 - t_tex_fac) + t_tex_fac * 0.0
-
-        # Texture coordinates.
-        for j in lons_p1_range:
-            s_tex = s_tex_cache[j]
-
-            vts[vt_hemi_offset_north] = (s_tex, t_tex_north)
-            vts[vt_hemi_offset_south] = (s_tex, t_tex_south)
-
-            vt_hemi_offset_north += 1
-            vt_hemi_offset_south += 1
+    # Coordinates, normals and texture coordinates of all latitude bands are
+    # generated at once by broadcasting the per-latitude (phi) terms against
+    # the per-longitude (theta) terms.
+    # Symmetries mean cos and sin only need to be called once.
+    phis = np.arange(1, half_lats) * to_phi
+    sin_phi_south = np.sin(phis)[:, None]
+    cos_phi_south = np.cos(phis)[:, None]
+    sin_phi_north = -cos_phi_south
+    cos_phi_north = sin_phi_south
+
+    # North coordinates & normals. On the unit capsule they are the same.
+    band = np.empty((half_lats_n1, verif_lons, 3))
+    band[..., 0] = cos_phi_north * cos_thetas
+    band[..., 1] = cos_phi_north * sin_thetas
+    band[..., 2] = -sin_phi_north
+    vns[1:idx_v_n_equator] = band.reshape(-1, 3)
+    vs[1:idx_v_n_equator] = band.reshape(-1, 3)
+
+    # South coordinates & normals.
+    band[..., 0] = cos_phi_south * cos_thetas
+    band[..., 1] = cos_phi_south * sin_thetas
+    band[..., 2] = -sin_phi_south
+    vns[idx_vn_south:idx_vn_south_pole] = band.reshape(-1, 3)
+    vs[idx_v_south:idx_v_south_pole] = band.reshape(-1, 3)
+
+    # Find vertical component of texture.
+    t_tex_fac = np.arange(1, half_lats) * to_tex_vertical
+    t_tex_north = 1.0 * (1.0 - t_tex_fac) + t_tex_fac * vt_aspect_north
+    t_tex_south = vt_aspect_south * (1.0 - t_tex_fac) + t_tex_fac * 0.0
+
+    # Texture coordinates.
+    band_vts = np.empty((half_lats_n1, verif_lons_p1, 2))
+    band_vts[..., 0] = s_tex_cache
+
+    band_vts[..., 1] = t_tex_north[:, None]
+    vts[verif_lons:idx_vt_n_equator] = band_vts.reshape(-1, 2)
+
+    band_vts[..., 1] = t_tex_south[:, None]
+    vts[idx_vt_s_hemi:idx_vt_s_cap] = band_vts.reshape(-1, 2)
 
     # Calculate rings of cylinder in middle.
     if calc_middle:
 
         # Linear interpolation must exclude the origin (North equator) and
         # destination (South equator), so step must not equal 0.0 or 1.0.
-        to_fac = 1.0 / verif_rings_p1
-        v_cyl_offset = idx_v_cyl
-        vt_cyl_offset = idx_vt_cyl
-
-        for m in range(1, verif_rings_p1):
-
-            fac = m * to_fac
-            cmpl_fac = 1.0 - fac
-            t_tex = vt_aspect_north * cmpl_fac + vt_aspect_south * fac
-
-            # Coordinates.
-            for j in lons_range:
-                # The x and y coordinates should be the same. North z should
-                # be half_depth while South z should be -half_depth. So interpolating
-                # between them is not strictly necessary.
-                v_equator_north = vs[idx_v_n_equator + j]
-                v_equator_south = vs[idx_v_s_equator + j]
-                vs[v_cyl_offset] = (
-                    v_equator_north[0] * cmpl_fac +
-                    v_equator_south[0] * fac,
-                    v_equator_north[1] * cmpl_fac +
-                    v_equator_south[1] * fac,
-                    v_equator_north[2] * cmpl_fac +
-                    v_equator_south[2] * fac)
-                v_cyl_offset += 1
-
-            # Texture coordinates.
-            for j in lons_p1_range:
-                s_tex = s_tex_cache[j]
-                vts[vt_cyl_offset] = (s_tex, t_tex)
-                vt_cyl_offset += 1
-
-    # Cylinder indices (quads).
-    f_cyl_offset = idx_fs_cyl
-    for m in range(0, verif_rings_p1):
-
-        v_curr_ring = idx_v_n_equator + m * verif_lons
-        v_next_ring = v_curr_ring + verif_lons
-
-        vt_curr_ring = idx_vt_n_equator + m * verif_lons_p1
-        vt_next_ring = vt_curr_ring + verif_lons_p1
-
-        for j in lons_range:
-            j_next_vt = j + 1
-            j_next_v = j_next_vt % verif_lons
-
-            # Coordinate quad.
-            v_indices[f_cyl_offset] = (
-                v_curr_ring + j,
-                v_next_ring + j,
-                v_next_ring + j_next_v,
-                v_curr_ring + j_next_v)
-
-            # Texture coordinate quad.
-            vt_indices[f_cyl_offset] = (
-                vt_curr_ring + j,
-                vt_next_ring + j,
-                vt_next_ring + j_next_vt,
-                vt_curr_ring + j_next_vt)
-
-            # Normals quad.
-            vn_indices[f_cyl_offset] = (
-                idx_v_n_equator + j,
-                idx_v_n_equator + j,
-                idx_v_n_equator + j_next_v,
-                idx_v_n_equator + j_next_v)
-
-            f_cyl_offset += 1
+        facs = np.arange(1, verif_rings_p1) / verif_rings_p1
+        cmpl_facs = 1.0 - facs
 
-    # Return a dictionary containing data.
-    return {"vs": vs,
-            "vts": vts,
-            "vns": vns,
-            "v_indices": v_indices,
-            "vt_indices": vt_indices,
-            "vn_indices": vn_indices}
+        # Coordinates. The x and y coordinates are the same as on the equators.
+        # Only the z offset is interpolated between half_depth (North) and
+        # -half_depth (South).
+        vs[idx_v_cyl:idx_v_s_equator] = np.tile(vs[idx_v_n_equator:idx_v_cyl], (verif_rings, 1))
+        z_facs[idx_v_cyl:idx_v_s_equator] = np.repeat(cmpl_facs - facs, verif_lons)
+
+        # Texture coordinates.
+        rings_vts = np.empty((verif_rings, verif_lons_p1, 2))
+        rings_vts[..., 0] = s_tex_cache
+        rings_vts[..., 1] = (vt_aspect_north * cmpl_facs + vt_aspect_south * facs)[:, None]
+        vts[idx_vt_cyl:idx_vt_s_equator] = rings_vts.reshape(-1, 2)
+
+    # Face indices. Every latitude band and cylinder ring is a strip of quads
+    # connecting a row of vertices with the next row.
+    lons_idx = np.arange(verif_lons)
+    lons_idx_next_vt = lons_idx + 1
+    lons_idx_next_v = lons_idx_next_vt % verif_lons
+    hemi_idx = np.arange(half_lats_n1)
+    rings_idx = np.arange(verif_rings_p1)
+
+    # North triangle fan.
+    v_indices[:verif_lons, 0] = 0
+    v_indices[:verif_lons, 1] = lons_idx_next_vt
+    v_indices[:verif_lons, 2] = 1 + lons_idx_next_v
+    vt_indices[:verif_lons, 0] = lons_idx
+    vt_indices[:verif_lons, 1] = verif_lons + lons_idx
+    vt_indices[:verif_lons, 2] = verif_lons + lons_idx_next_vt
+    vn_indices[:verif_lons, :3] = v_indices[:verif_lons, :3]
+
+    # North hemisphere quads.
+    v_indices[verif_lons:idx_fs_cyl] = _quad_strip_indices(
+        1 + hemi_idx * verif_lons, verif_lons, lons_idx, lons_idx_next_v)
+    vt_indices[verif_lons:idx_fs_cyl] = _quad_strip_indices(
+        verif_lons + hemi_idx * verif_lons_p1, verif_lons_p1, lons_idx, lons_idx_next_vt)
+    vn_indices[verif_lons:idx_fs_cyl] = v_indices[verif_lons:idx_fs_cyl]
+
+    # Cylinder quads. All rings share the equatorial normals.
+    v_indices[idx_fs_cyl:idx_fs_south_equat] = _quad_strip_indices(
+        idx_v_n_equator + rings_idx * verif_lons, verif_lons, lons_idx, lons_idx_next_v)
+    vt_indices[idx_fs_cyl:idx_fs_south_equat] = _quad_strip_indices(
+        idx_vt_n_equator + rings_idx * verif_lons_p1, verif_lons_p1, lons_idx, lons_idx_next_vt)
+    vn_indices[idx_fs_cyl:idx_fs_south_equat] = _quad_strip_indices(
+        np.full(verif_rings_p1, idx_v_n_equator), 0, lons_idx, lons_idx_next_v)
+
+    # South hemisphere quads.
+    v_indices[idx_fs_south_equat:idx_fs_south_hemi] = _quad_strip_indices(
+        idx_v_s_equator + hemi_idx * verif_lons, verif_lons, lons_idx, lons_idx_next_v)
+    vt_indices[idx_fs_south_equat:idx_fs_south_hemi] = _quad_strip_indices(
+        idx_vt_s_equator + hemi_idx * verif_lons_p1, verif_lons_p1, lons_idx, lons_idx_next_vt)
+    vn_indices[idx_fs_south_equat:idx_fs_south_hemi] = _quad_strip_indices(
+        idx_v_n_equator + hemi_idx * verif_lons, verif_lons, lons_idx, lons_idx_next_v)
+
+    # South triangle fan.
+    v_indices[idx_fs_south_hemi:, 0] = idx_v_south_pole
+    v_indices[idx_fs_south_hemi:, 1] = idx_v_south_cap + lons_idx_next_v
+    v_indices[idx_fs_south_hemi:, 2] = idx_v_south_cap + lons_idx
+    vt_indices[idx_fs_south_hemi:, 0] = idx_vt_s_cap + lons_idx
+    vt_indices[idx_fs_south_hemi:, 1] = idx_vt_s_polar + lons_idx_next_vt
+    vt_indices[idx_fs_south_hemi:, 2] = idx_vt_s_polar + lons_idx
+    vn_indices[idx_fs_south_hemi:, 0] = idx_vn_south_pole
+    vn_indices[idx_fs_south_hemi:, 1] = idx_vn_south_cap + lons_idx_next_v
+    vn_indices[idx_fs_south_hemi:, 2] = idx_vn_south_cap + lons_idx
+
+    capsule_unit = (vs, z_facs, vts, vns, v_indices, vt_indices, vn_indices)
+    for data in capsule_unit:
+        data.flags.writeable = False
+
+    return capsule_unit
@@ -60,18 +60,25 @@ def construct_python_faces(bmesh_faces):
     py_verts = []
     py_faces = []
     py_face_mat = []
+    # new vertex index by coordinate, to look up vertices without searching py_verts
+    vert_indices = {}
 
     for f in bmesh_faces:
         # cur_face_indices holds the new indices of our verts per face
         cur_face_indices = []
 
         for v in f.verts:
-            if v.co not in py_verts:
+            co = v.co.to_tuple()
+            index = vert_indices.get(co)
+            if index is None:
                 # this vert is found for the first time, add it
-                py_verts.append(v.co)
+                index = len(py_verts)
+                vert_indices[co] = index
+                # copy the coordinate, the BMesh is freed before the vertices are used
+                py_verts.append(v.co.copy())
 
             # add the new index of the current vert to the current face index list
-            cur_face_indices.append(py_verts.index(v.co))
+            cur_face_indices.append(index)
 
         # face index list construction is complete, add it to the face list
         py_faces.append(cur_face_indices)
@@ -107,6 +114,7 @@ def get_face_islands(bm, faces, face_islands=[], i=0):
         linked_faces = get_linked_faces(faces[0])
         face_islands.append(construct_python_faces(linked_faces))
 
+        linked_faces = set(linked_faces)
         remaining_faces = [face for face in faces if face not in linked_faces]
 
         i = i + 1
@@ -117,7 +125,7 @@ def get_face_islands(bm, faces, face_islands=[], i=0):
 
 def create_objs_from_island(obj, use_world=True):
     """
-    Create separate objects from face islands of the given object in edit mode.
+    Create separate objects from face islands of the given object.
 
     Parameters:
     obj (bpy.types.Object): The Blender object to process.
@@ -129,10 +137,9 @@ def create_objs_from_island(obj, use_world=True):
 
     wld_mat = obj.matrix_world
 
-    # change mode to editmode
-    bpy.context.view_layer.objects.active = obj
-    bpy.ops.object.mode_set(mode='EDIT')
-    bm = bmesh.from_edit_mesh(obj.data)
+    # read the mesh data directly instead of switching the object to edit mode
+    bm = bmesh.new()
+    bm.from_mesh(obj.data)
 
     face_islands = []
     face_islands = get_face_islands(bm, bm.faces, face_islands)
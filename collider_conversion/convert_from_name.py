@@ -17,11 +17,10 @@ class OBJECT_OT_convert_from_name(Operator):
 
     @classmethod
     def poll(cls, context):
-        count = 0
         for obj in context.selected_objects:
             if obj.type in ['MESH', 'CURVE', 'SURFACE', 'FONT', 'META']:
-                count = count + 1
-        return count > 0
+                return True
+        return False
 
 
     def execute(self, context):
@@ -37,11 +37,10 @@ class OBJECT_OT_convert_to_mesh(Operator):
 
     @classmethod
     def poll(cls, context):
-        count = 0
         for obj in context.selected_objects:
             if obj.type in ['MESH', 'CURVE', 'SURFACE', 'FONT', 'META']:
-                count = count + 1
-        return count > 0
+                return True
+        return False
 
     def execute(self, context):
         colSettings = context.scene.simple_collider
@@ -14,11 +14,10 @@ class COLLISION_OT_assign_shape(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        count = 0
         for obj in context.selected_objects:
             if obj.type in ['MESH', 'CURVE', 'SURFACE', 'FONT', 'META']:
-                count = count + 1
-        return count > 0
+                return True
+        return False
 
     def execute(self, context):
         prefs = context.preferences.addons[base_package].preferences
@@ -42,13 +41,11 @@ class COLLISION_OT_assign_shape(bpy.types.Operator):
         regex_list = [pattern_box_shape, pattern_sphere_shape, pattern_capsule_shape, pattern_convex_shape,
                       pattern_mesh_shape]
 
-        count = 0
-        for obj in context.selected_objects.copy():
-            # skip if invalid object
-            if obj is None or obj.type not in ['MESH', 'CURVE', 'SURFACE', 'FONT', 'META'] or not obj.get('isCollider'):
-                continue
-            count += 1
+        # only valid collider objects get the new shape
+        colliders = [obj for obj in context.selected_objects
+                     if obj.type in ['MESH', 'CURVE', 'SURFACE', 'FONT', 'META'] and obj.get('isCollider')]
 
+        for obj in colliders:
             new_name = obj.name
             for regex in regex_list:
                 new_name = re.sub(regex, '', new_name)  # Assign the result back to new_name
@@ -65,7 +62,7 @@ class COLLISION_OT_assign_shape(bpy.types.Operator):
             obj.name = new_name
             OBJECT_OT_add_bounding_object.set_data_name(obj, new_name, "_data")
 
-        if count == 0:
+        if not colliders:
             self.report({'WARNING'}, "No collider found to change the user group.")
             return {'CANCELLED'}
 
@@ -133,8 +133,7 @@ class COLLISION_OT_Deletion(bpy.types.Operator):
             self.report({'INFO'}, 'No objects to delete.')
 
         else:
-            for obj in objects_to_remove:
-                bpy.data.objects.remove(obj, do_unlink=True)
+            bpy.data.batch_remove(objects_to_remove)
 
         return {'FINISHED'}
 
@@ -1,7 +1,8 @@
 import bpy
+import numpy as np
 from bpy.types import Operator
 
-from .add_bounding_primitive import OBJECT_OT_add_bounding_object
+from .add_bounding_primitive import OBJECT_OT_add_bounding_object, transform_coordinates
 from ..bmesh_operations.box_creation import verts_faces_to_bbox_collider
 
 tmp_name = 'box_collider'
@@ -15,6 +16,7 @@ class OBJECT_OT_add_bounding_box(OBJECT_OT_add_bounding_object, Operator):
 
     def __init__(self):
         super().__init__()
+        self.use_collider_pool = True
         self.use_space = True
         self.use_modifier_stack = True
         self.use_global_local_switches = True
@@ -57,13 +59,12 @@ class OBJECT_OT_add_bounding_box(OBJECT_OT_add_bounding_object, Operator):
 
         # List for storing dictionaries of data used to generate the collision meshes
         collider_data = []
+        # arrays of global space vertex coordinates for the SELECTION mode
         verts_co = []
 
         objs = self.get_pre_processed_mesh_objs(context, use_local=True, local_world_spc=False, default_world_spc=True)
 
         for base_ob, obj in objs:
-
-            context.view_layer.objects.active = obj
             bounding_box_data = {}
 
             # EDIT is only supported for 'MESH' type objects and only if the active object is a 'MESH'
@@ -82,7 +83,7 @@ class OBJECT_OT_add_bounding_box(OBJECT_OT_add_bounding_object, Operator):
             if creation_mode in ['INDIVIDUAL'] or self.use_loose_mesh:
 
                 # used_vertices uses local space.
-                co = self.get_vertex_coordinates(obj, self.my_space, used_vertices)
+                co = self.get_vertex_coordinates_array(obj, self.my_space, used_vertices)
                 verts_loc, center_point = self.generate_bounding_box(co)
 
                 # store data needed to generate a bounding box in a dictionary
@@ -94,10 +95,11 @@ class OBJECT_OT_add_bounding_box(OBJECT_OT_add_bounding_object, Operator):
                 collider_data.append(bounding_box_data)
 
             else:  # if self.creation_mode[self.creation_mode_idx] == 'SELECTION':
-                # get list of all vertex coordinates in global space
-                ws_vtx_co = self.get_vertex_coordinates(obj, 'GLOBAL', used_vertices)
-                verts_co = verts_co + ws_vtx_co
-                collider_data = self.selection_bbox_data(verts_co)
+                # get all vertex coordinates in global space
+                verts_co.append(self.get_vertex_coordinates_array(obj, 'GLOBAL', used_vertices))
+
+        if verts_co:
+            collider_data = self.selection_bbox_data(np.concatenate(verts_co))
 
         bpy.ops.object.mode_set(mode='OBJECT')
 
@@ -145,8 +147,7 @@ class OBJECT_OT_add_bounding_box(OBJECT_OT_add_bounding_object, Operator):
 
     def selection_bbox_data(self, verts_co):
         if self.my_space == 'LOCAL':
-            ws_vtx_co = verts_co
-            verts_co = self.transform_vertex_space(ws_vtx_co, self.active_obj)
+            verts_co = transform_coordinates(verts_co, self.active_obj.matrix_world.inverted())
 
         bbox_verts, center_point = self.generate_bounding_box(verts_co)
         mtx_world = self.active_obj.matrix_world
@@ -4,7 +4,7 @@ from bpy.types import Operator
 from mathutils import Vector, Matrix
 from .add_bounding_primitive import OBJECT_OT_add_bounding_object
 from .utilities import get_sca_matrix
-from ..bmesh_operations.capsule_generation import create_capsule_data, calculate_radius_height, mesh_data_to_bmesh
+from ..bmesh_operations.capsule_generation import create_capsule_data, calculate_radius_height, mesh_data_to_mesh
 
 tmp_name = 'capsule_collider'
 
@@ -17,6 +17,7 @@ class OBJECT_OT_add_bounding_capsule(OBJECT_OT_add_bounding_object, Operator):
 
     def __init__(self):
         super().__init__()
+        self.use_collider_pool = True
         self.use_space = True
         self.use_modifier_stack = True
         self.use_global_local_switches = True
@@ -77,8 +78,6 @@ class OBJECT_OT_add_bounding_capsule(OBJECT_OT_add_bounding_object, Operator):
 
         # iterate over base objects
         for base_object, obj in objects:
-
-            context.view_layer.objects.active = obj
             bounding_capsule_data = {}
 
             if self.obj_mode == "EDIT" and base_object.type == 'MESH' and self.active_obj.type == 'MESH' and not self.use_loose_mesh:
@@ -97,21 +96,28 @@ class OBJECT_OT_add_bounding_capsule(OBJECT_OT_add_bounding_object, Operator):
             creation_mode = self.creation_mode[self.creation_mode_idx] if self.obj_mode == 'OBJECT' else \
                 self.creation_mode_edit[self.creation_mode_idx]
 
-            vertex_coords_global = self.get_vertex_coordinates(obj, 'GLOBAL', used_vertices)
+            vertex_coords_global = self.get_vertex_coordinates_array(obj, 'GLOBAL', used_vertices)
 
             if creation_mode in ['INDIVIDUAL'] or self.use_loose_mesh:
-                vertex_coords = vertex_coords_global
+                # Skip degenerate objects. At least two points are required to define a capsule.
+                if len(vertex_coords_global) < 2:
+                    continue
 
+                # Only the capsule dimensions are stored, so the vertex coordinates of one object can be freed
+                # before the next object is processed.
+                radius, height, center_capsule, rotation_matrix_4x4 = calculate_radius_height(vertex_coords_global,
+                                                                                              self.cylinder_axis)
 
-                bounding_capsule_data = {'parent': base_object, 'vertex_coords': vertex_coords}
+                bounding_capsule_data = {'parent': base_object, 'radius': radius, 'height': height,
+                                         'center': center_capsule}
                 collider_data.append(bounding_capsule_data)
 
-
-
             else:  # creation_mode == 'SELECTION':
                 # add all vertices in global space to the list
                 selection_vertex_coords.extend(vertex_coords_global)
 
+            del vertex_coords_global
+
         if creation_mode == 'SELECTION':
             bounding_capsule_data = {'parent': self.active_obj,
                                      'vertex_coords': selection_vertex_coords}
@@ -121,12 +127,12 @@ class OBJECT_OT_add_bounding_capsule(OBJECT_OT_add_bounding_object, Operator):
 
         for bounding_capsule_data in collider_data:
             parent = bounding_capsule_data['parent']
-            vertex_coords = bounding_capsule_data['vertex_coords']
 
             if creation_mode == 'INDIVIDUAL' or self.use_loose_mesh:
                 # coordinates are based on self.my_space
-                radius, height, center_capsule, rotation_matrix_4x4 = calculate_radius_height(vertex_coords,
-                                                                                              self.cylinder_axis)
+                radius = bounding_capsule_data['radius']
+                height = bounding_capsule_data['height']
+                center_capsule = bounding_capsule_data['center']
 
                 capsule_data = create_capsule_data(longitudes=self.current_settings_dic['capsule_segments'],
                                                    latitudes=int(self.current_settings_dic['capsule_segments']),
@@ -134,19 +140,14 @@ class OBJECT_OT_add_bounding_capsule(OBJECT_OT_add_bounding_object, Operator):
                                                    depth=height * self.current_settings_dic['height_mult'],
                                                    uv_profile="FIXED")
 
-                bm = mesh_data_to_bmesh(
+                mesh_data = mesh_data_to_mesh(
+                    "Capsule",
                     vs=capsule_data["vs"],
                     vts=capsule_data["vts"],
-                    vns=capsule_data["vns"],
                     v_indices=capsule_data["v_indices"],
-                    vt_indices=capsule_data["vt_indices"],
-                    vn_indices=capsule_data["vn_indices"])
-
-                mesh_data = bpy.data.meshes.new("Capsule")
-                bm.to_mesh(mesh_data)
-                bm.free()
+                    vt_indices=capsule_data["vt_indices"])
 
-                new_collider = bpy.data.objects.new(mesh_data.name, mesh_data)
+                new_collider = self.new_collider_object(mesh_data.name, mesh_data)
 
                 # it works when the origin is centered
                 # align object to parent object
@@ -1,5 +1,6 @@
 import bmesh
 import bpy
+import numpy as np
 from bpy.types import Operator
 
 from .add_bounding_primitive import OBJECT_OT_add_bounding_object
@@ -13,6 +14,7 @@ class OBJECT_OT_add_convex_hull(OBJECT_OT_add_bounding_object, Operator):
 
     def __init__(self):
         super().__init__()
+        self.use_collider_pool = True
         self.use_decimation = True
         self.use_geo_nodes_hull = True
         self.use_modifier_stack = True
@@ -46,6 +48,7 @@ class OBJECT_OT_add_convex_hull(OBJECT_OT_add_bounding_object, Operator):
 
         # List for storing dictionaries of data used to generate the collision meshes
         collider_data = []
+        # arrays of global space vertex coordinates for the SELECTION mode
         verts_co = []
 
         objs = self.get_pre_processed_mesh_objs(context, default_world_spc=True)
@@ -63,7 +66,7 @@ class OBJECT_OT_add_convex_hull(OBJECT_OT_add_bounding_object, Operator):
             if used_vertices is None:  # Skip object if there is no Mesh data to create the collider
                 continue
 
-            ws_vtx_co = self.get_vertex_coordinates(obj, 'GLOBAL', used_vertices)
+            ws_vtx_co = self.get_vertex_coordinates_array(obj, 'GLOBAL', used_vertices)
 
             creation_mode = self.creation_mode[self.creation_mode_idx] if self.obj_mode == 'OBJECT' else \
                 self.creation_mode_edit[self.creation_mode_idx]
@@ -78,15 +81,14 @@ class OBJECT_OT_add_convex_hull(OBJECT_OT_add_bounding_object, Operator):
                 collider_data.append(convex_collision_data)
 
             else:  # if self.creation_mode[self.creation_mode_idx] == 'SELECTION':
-                # get list of all vertex coordinates in global space
-
-                verts_co = verts_co + ws_vtx_co
-
-                convex_collision_data = {}
-                convex_collision_data['parent'] = self.active_obj
-                convex_collision_data['verts_loc'] = verts_co
-                collider_data = [convex_collision_data]
+                # collect the vertex coordinates of all objects in global space
+                verts_co.append(ws_vtx_co)
 
+        if verts_co:
+            convex_collision_data = {}
+            convex_collision_data['parent'] = self.active_obj
+            convex_collision_data['verts_loc'] = np.concatenate(verts_co)
+            collider_data = [convex_collision_data]
 
         bpy.context.view_layer.objects.active = self.active_obj
         bpy.ops.object.mode_set(mode='OBJECT')
@@ -99,9 +101,13 @@ class OBJECT_OT_add_convex_hull(OBJECT_OT_add_bounding_object, Operator):
             if self.prefs.debug:
                 self.create_debug_object_from_verts(context, verts_loc)
 
+            # add all vertices to the mesh at once and create the BMesh from it
+            me = bpy.data.meshes.new("mesh")
+            me.vertices.add(len(verts_loc))
+            me.vertices.foreach_set('co', verts_loc.astype(np.float32).ravel())
+
             bm = bmesh.new()
-            for v in verts_loc:
-                bm.verts.new(v)  # add a new vert
+            bm.from_mesh(me)
 
             ch = bmesh.ops.convex_hull(bm, input=bm.verts)
 
@@ -111,11 +117,10 @@ class OBJECT_OT_add_convex_hull(OBJECT_OT_add_bounding_object, Operator):
                 context='VERTS',
             )
 
-            me = bpy.data.meshes.new("mesh")
             bm.to_mesh(me)
             bm.free()
 
-            new_collider = bpy.data.objects.new('colliders', me)
+            new_collider = self.new_collider_object('colliders', me)
             context.scene.collection.objects.link(new_collider)
 
             self.custom_set_parent(context, parent, new_collider)
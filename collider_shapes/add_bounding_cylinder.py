@@ -483,7 +483,7 @@ class OBJECT_OT_add_bounding_cylinder(OBJECT_OT_add_bounding_object, Operator):
             used_vertices = self.get_used_vertices(base_ob, obj)
 
             # If no vertices are found, skip to the next object
-            if not used_vertices:
+            if used_vertices is None:
                 continue
 
 
@@ -498,19 +498,20 @@ class OBJECT_OT_add_bounding_cylinder(OBJECT_OT_add_bounding_object, Operator):
                 coordinates = []
                 height = []
 
-                co = self.get_vertex_coordinates(
+                co = self.get_vertex_coordinates_array(
                     obj, self.my_space, used_vertices)
                 bounding_box, center = self.generate_bounding_box(co)
 
-                for vertex in used_vertices:
-
+                # build the vertex matrix once instead of for every vertex
+                if self.my_space == 'LOCAL':
                     # Ignore Scale
-                    if self.my_space == 'LOCAL':
-                        v = vertex.co @ get_sca_matrix(sca)
-                    else:
-                        # Scale has to be applied before location
-                        v = vertex.co @ get_sca_matrix(
-                            sca) @ get_loc_matrix(loc) @ get_rot_matrix(rot)
+                    vertex_matrix = get_sca_matrix(sca)
+                else:
+                    # Scale has to be applied before location
+                    vertex_matrix = get_sca_matrix(sca) @ get_loc_matrix(loc) @ get_rot_matrix(rot)
+
+                for vertex_co in self.get_vertex_coordinates(obj, 'LOCAL', used_vertices):
+                    v = vertex_co @ vertex_matrix
 
                     if self.cylinder_axis == 'X':
                         coordinates.append([v.y, v.z])
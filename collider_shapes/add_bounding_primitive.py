@@ -16,6 +16,34 @@ from ..pyshics_materials.material_functions import assign_physics_material, crea
     set_active_physics_material, set_material
 
 
+# Display names of the collider shape identifiers. Every other identifier is shown as 'MESH'.
+SHAPE_NAMES = {
+    'box_shape': 'BOX',
+    'sphere_shape': 'SPHERE',
+    'capsule_shape': 'CAPSULE',
+    'convex_shape': 'CONVEX',
+    'mesh_shape': 'MESH',
+}
+
+# Select the min (0) or max (1) coordinate of every axis for the 8 corners of a bounding box.
+BOUNDING_BOX_CORNERS = numpy.array([
+    (1, 1, 0),
+    (1, 0, 0),
+    (0, 0, 0),
+    (0, 1, 0),
+    (1, 1, 1),
+    (1, 0, 1),
+    (0, 0, 1),
+    (0, 1, 1),
+])
+
+# Minimum time in seconds between two collider regenerations while a value is changed with the mouse.
+REGENERATION_INTERVAL = 0.3
+
+# Mouse movement in pixels below which segment counts are not recalculated.
+SEGMENTS_MOUSE_THRESHOLD = 2
+
+
 def alignObjects(new, old):
     """Align two objects"""
     new.matrix_world = old.matrix_world
@@ -52,69 +80,49 @@ def geometry_node_group_empty_new():
     return group
 
 
-def draw_modal_item(self, context, font_id, i, vertical_px_offset, left_margin, label, value=None, type='default',
-                    key='',
-                    highlight=False):
-    """Draw label in the 3D Viewport"""
+def set_blf_color(self, font_id, color):
+    """Set the font color. The state change is skipped if the color is already set"""
+    color = tuple(color)
+    if color != self.blf_color:
+        blf.color(font_id, *color)
+        self.blf_color = color
 
-    # get colors from preferences
-    col_default = self.prefs.modal_color_default
-    color_title = self.prefs.modal_color_title
-    color_ignore_input = [0.5, 0.5, 0.5, 0.5]
 
-    # operator colors
-    color_enum = self.prefs.modal_color_enum
-    color_modal = self.prefs.modal_color_modal
-    color_bool = self.prefs.modal_color_bool
-    color_highlight = self.prefs.modal_color_highlight
-    color_error = self.prefs.modal_color_error
+def draw_modal_item(self, context, font_id, i, vertical_px_offset, left_margin, key_margin, value_margin, label,
+                    value=None, type='default', key='', highlight=False):
+    """Draw label in the 3D Viewport"""
 
-    # padding bottom
-    font_size = int(self.prefs.modal_font_size * context.preferences.view.ui_scale / 3.6)
+    # colors are read from the preferences once per redraw in draw_viewport_overlay
+    color_map = self.modal_colors
+    col_default = color_map['default']
+    color_ignore_input = color_map['disabled']
+    color_highlight = color_map['highlight']
 
     # padding_bottom = self.prefs.padding_bottom
     padding_bottom = 0
+    vertical_position = padding_bottom + (i * vertical_px_offset)
 
-    if bpy.app.version < (4, 00):
-        # legacy support
-        blf.size(font_id, 72, font_size)
-    else:
-        blf.size(font_id, font_size)
-
-    color_map = {
-        'error': color_error,
-        'key_title': color_highlight if self.ignore_input or self.navigation else color_title,
-        'disabled': color_ignore_input,
-        'title': color_title,
-        'default': col_default,
-        'bool': color_bool,
-        'enum': color_enum,
-        'modal': color_modal
-    }
-
-    blf.color(font_id, *color_map.get(type, col_default))
-    blf.position(font_id, left_margin, padding_bottom + (i * vertical_px_offset), 0)
+    set_blf_color(self, font_id, color_map.get(type, col_default))
+    blf.position(font_id, left_margin, vertical_position, 0)
     blf.draw(font_id, label)
 
     if key:
-        blf.color(font_id,
-                  *color_ignore_input if self.ignore_input or self.navigation else color_map.get(type, col_default))
-        blf.position(font_id, left_margin + 220 / 20 * font_size, padding_bottom + (i * vertical_px_offset), 0)
+        set_blf_color(self, font_id,
+                      color_ignore_input if self.ignore_input or self.navigation else color_map.get(type, col_default))
+        blf.position(font_id, key_margin, vertical_position, 0)
         blf.draw(font_id, key)
 
     if value:
         if self.ignore_input or self.navigation:
-            blf.color(font_id, color_ignore_input[0], color_ignore_input[1], color_ignore_input[2],
-                      color_ignore_input[3])
+            set_blf_color(self, font_id, color_ignore_input)
         elif highlight:
-            blf.color(font_id, color_highlight[0], color_highlight[1], color_highlight[2], color_highlight[3])
+            set_blf_color(self, font_id, color_highlight)
         elif type == 'disabled':
-            blf.color(font_id, color_ignore_input[0], color_ignore_input[1], color_ignore_input[2],
-                      color_ignore_input[3])
+            set_blf_color(self, font_id, color_ignore_input)
         else:  # type == 'default':
-            blf.color(font_id, col_default[0], col_default[1], col_default[2], col_default[3])
+            set_blf_color(self, font_id, col_default)
 
-        blf.position(font_id, left_margin + 290 / 20 * font_size, padding_bottom + (i * vertical_px_offset), 0)
+        blf.position(font_id, value_margin, vertical_position, 0)
         blf.draw(font_id, value)
 
     return i + 1
@@ -307,11 +315,32 @@ def draw_viewport_overlay(self, context):
         item = {'label': label, 'value': None, 'key': '', 'type': type, 'highlight': False}
         items.append(item)
 
+    # get colors from preferences
+    prefs = self.prefs
+    color_ignore_input = (0.5, 0.5, 0.5, 0.5)
+    color_title = tuple(prefs.modal_color_title)
+    color_highlight = tuple(prefs.modal_color_highlight)
+
+    # operator colors
+    self.modal_colors = {
+        'error': tuple(prefs.modal_color_error),
+        'key_title': color_highlight if self.ignore_input or self.navigation else color_title,
+        'disabled': color_ignore_input,
+        'title': color_title,
+        'default': tuple(prefs.modal_color_default),
+        'bool': tuple(prefs.modal_color_bool),
+        'enum': tuple(prefs.modal_color_enum),
+        'modal': tuple(prefs.modal_color_modal),
+        'highlight': color_highlight,
+    }
+
     # text properties
     font_id = 0  # XXX, need to find out how best to get this.
-    font_size = int(self.prefs.modal_font_size * context.preferences.view.ui_scale / 3.6)
+    font_size = int(prefs.modal_font_size * context.preferences.view.ui_scale / 3.6)
     vertical_px_offset = font_size * 1.5
     left_text_margin = bpy.context.area.width / 2 - 190 / 20 * font_size
+    key_text_margin = left_text_margin + 220 / 20 * font_size
+    value_text_margin = left_text_margin + 290 / 20 * font_size
 
     # backdrop box
     box_left = bpy.context.area.width / 2 - 240 / 20 * font_size
@@ -319,16 +348,23 @@ def draw_viewport_overlay(self, context):
     box_top = font_size * len(items) * 1.75
     box_bottom = 10
 
-    prefs = self.prefs
     color = prefs.modal_box_color
 
     if prefs.use_modal_box:
         draw_2d_backdrop(self, context, box_left, box_right, box_top, box_bottom, color)
 
+    # The font size and color are blf state. Set the size once and only change the color when it differs.
+    if bpy.app.version < (4, 00):
+        # legacy support
+        blf.size(font_id, 72, font_size)
+    else:
+        blf.size(font_id, font_size)
+    self.blf_color = None
+
     for i, item in enumerate(items):
-        draw_modal_item(self, context, font_id, i + 1, vertical_px_offset, left_text_margin, item['label'],
-                        value=item['value'],
-                        key=item['key'], type=item['type'], highlight=item['highlight'])
+        draw_modal_item(self, context, font_id, i + 1, vertical_px_offset, left_text_margin, key_text_margin,
+                        value_text_margin, item['label'], value=item['value'], key=item['key'], type=item['type'],
+                        highlight=item['highlight'])
 
 
 def draw_2d_backdrop(self, context, left, right, top, bottom, color):
@@ -365,10 +401,14 @@ def get_rot_matrix(rotation):
 
 def get_sca_matrix(scale):
     """get scale matrix"""
-    scale_mx = Matrix()
-    for i in range(3):
-        scale_mx[i][i] = scale[i]
-    return scale_mx
+    return Matrix.Diagonal((scale[0], scale[1], scale[2], 1.0))
+
+
+def transform_coordinates(co, matrix):
+    """transform an (N, 3) numpy array of coordinates by a 4x4 matrix"""
+    # use the precision of the coordinates to avoid converting the whole array
+    mtx = numpy.array(matrix, dtype=co.dtype)
+    return co @ mtx[:3, :3].T + mtx[:3, 3]
 
 
 def collision_dictionary(alpha, offset, decimate, sphere_segments, cylinder_segments, capsule_segments,
@@ -402,10 +442,13 @@ class OBJECT_OT_add_bounding_object():
     @staticmethod
     def calculate_center_of_mass(obj):
         """calculate center of mass. """
-        x, y, z = [sum([(obj.matrix_world.inverted() @ v.co)[i] for v in obj.data.vertices]) for i
-                   in range(3)]
-        count = float(len(obj.data.vertices))
-        center = obj.matrix_world @ (Vector((x, y, z)) / count)
+        vertices = obj.data.vertices
+        co = numpy.empty(len(vertices) * 3, dtype=numpy.float32)
+        vertices.foreach_get('co', co)
+
+        # Transforming every vertex by the inverted world matrix and the mean back by the world matrix cancels
+        # out, so the center is the mean of the local coordinates.
+        center = Vector(co.reshape(-1, 3).mean(axis=0, dtype=numpy.float64))
 
         return center
 
@@ -458,47 +501,17 @@ class OBJECT_OT_add_bounding_object():
         # set the location back to the old location
         obj.location = ob_loc
 
-    @classmethod
-    def split_coordinates_xyz(cls, v_co_list):
-        """Split a list of vertex locations into lists for the X Y Z component """
-        positionsX = []
-        positionsY = []
-        positionsZ = []
-
-        # generate a lists of all x, y and z coordinates to find the min and max
-        for co in v_co_list:
-            positionsX.append(co[0])
-            positionsY.append(co[1])
-            positionsZ.append(co[2])
-
-        return positionsX, positionsY, positionsZ
-
     @classmethod
     def generate_bounding_box(cls, v_co):
         """get the min and max coordinates for the bounding box"""
 
-        positionsX, positionsY, positionsZ = cls.split_coordinates_xyz(v_co)
+        co = numpy.asarray(v_co, dtype=numpy.float64).reshape(-1, 3)
+        bounds = numpy.stack((co.min(axis=0), co.max(axis=0)))
 
-        min_x = min(positionsX)
-        min_y = min(positionsY)
-        min_z = min(positionsZ)
+        # (8, 3) array of the corner coordinates
+        verts = bounds[BOUNDING_BOX_CORNERS, (0, 1, 2)]
 
-        max_x = max(positionsX)
-        max_y = max(positionsY)
-        max_z = max(positionsZ)
-
-        verts = [
-            (max_x, max_y, min_z),
-            (max_x, min_y, min_z),
-            (min_x, min_y, min_z),
-            (min_x, max_y, min_z),
-            (max_x, max_y, max_z),
-            (max_x, min_y, max_z),
-            (min_x, min_y, max_z),
-            (min_x, max_y, max_z),
-        ]
-
-        center_point = Vector(((min_x + max_x) / 2, (min_y + max_y) / 2, (min_z + max_z) / 2))
+        center_point = Vector(bounds.mean(axis=0))
 
         return verts, center_point
 
@@ -514,26 +527,42 @@ class OBJECT_OT_add_bounding_object():
 
     @staticmethod
     def unique_name(name):
-        """recursive function to find unique name"""
-        count = 1
-        new_name = name
+        """find unique name. Numbered names are usually taken without gaps, so an unused number is found by
+        doubling the number and bisecting the last step instead of testing every number"""
+        objects = bpy.data.objects
+        if name not in objects:
+            return name
+
+        # low is a used number (or 0), high the first unused number found by doubling
+        low, high = 0, 1
+        while create_name_number(name, high) in objects:
+            low, high = high, high * 2
+
+        while high - low > 1:
+            mid = (low + high) // 2
+            if create_name_number(name, mid) in objects:
+                low = mid
+            else:
+                high = mid
 
-        while new_name in bpy.data.objects:
-            new_name = create_name_number(name, count)
-            count = count + 1
-        return new_name
+        return create_name_number(name, high)
 
     @staticmethod
     def custom_set_parent(context, parent, child):
         """Custom set parent"""
-        for obj in context.selected_objects.copy():
-            obj.select_set(False)
-
-        context.view_layer.objects.active = parent
-        parent.select_set(True)
-        child.select_set(True)
+        # Parent through the data API instead of bpy.ops.object.parent_set. The operator needs the selection and
+        # active object to be changed and updates the scene for every collider. The parent inverse keeps the
+        # transformation of the child like keep_transform does.
+        # The child can still have the parent of the object it was copied from, so its world matrix is calculated
+        # from the current parent before reparenting.
+        if child.parent:
+            mtx_world = child.parent.matrix_world @ child.matrix_parent_inverse @ child.matrix_basis
+        else:
+            mtx_world = child.matrix_basis.copy()
 
-        bpy.ops.object.parent_set(type='OBJECT', keep_transform=True)
+        child.parent = parent
+        child.matrix_parent_inverse = parent.matrix_world.inverted_safe()
+        child.matrix_basis = mtx_world
 
     @classmethod
     def bmesh(cls, bm):
@@ -541,8 +570,14 @@ class OBJECT_OT_add_bounding_object():
         cls.bm.append(bm)
 
     @classmethod
-    def class_collider_name(cls, shape_identifier, user_group, basename='Basename'):
-        prefs = bpy.context.preferences.addons[base_package].preferences
+    def class_collider_name(cls, shape_identifier, user_group, basename='Basename', prefs=None):
+        return cls.unique_name(cls.class_collider_base_name(shape_identifier, user_group, basename, prefs))
+
+    @classmethod
+    def class_collider_base_name(cls, shape_identifier, user_group, basename='Basename', prefs=None):
+        """Return the collider name before a number is added to make it unique"""
+        if prefs is None:
+            prefs = bpy.context.preferences.addons[base_package].preferences
         separator = prefs.separator
 
         if prefs.replace_name:
@@ -577,7 +612,7 @@ class OBJECT_OT_add_bounding_object():
                     name_pre_suffix = name_pre_suffix + comp + separator
             new_name = name_pre_suffix + name
 
-        return cls.unique_name(new_name)
+        return new_name
 
     def draw_callback_px(self, context):
 
@@ -599,63 +634,101 @@ class OBJECT_OT_add_bounding_object():
     def collider_name(self, basename='Basename'):
         self.basename = basename
         user_group = self.collision_groups[self.collision_group_idx].identifier
-        return self.class_collider_name(shape_identifier=self.shape, user_group=user_group, basename=basename)
+
+        # Only the unique number depends on the objects in the scene. The rest of the name is cached as the
+        # preferences can't change while the operator is running.
+        key = (self.shape, user_group, basename)
+        name = self.collider_name_cache.get(key)
+        if name is None:
+            name = self.class_collider_base_name(shape_identifier=self.shape, user_group=user_group,
+                                                 basename=basename, prefs=self.prefs)
+            self.collider_name_cache[key] = name
+
+        return self.unique_name(name)
 
     def get_shape_name(self):
         """ Return Shape String """
-        if self.shape == 'box_shape':
-            return 'BOX'
-        elif self.shape == 'sphere_shape':
-            return 'SPHERE'
-        elif self.shape == 'capsule_shape':
-            return 'CAPSULE'
-        elif self.shape == 'convex_shape':
-            return 'CONVEX'
-        else:  # identifier == 'mesh_shape':
-            return 'MESH'
+        return SHAPE_NAMES.get(self.shape, 'MESH')
 
     @staticmethod
     def get_shape_pre_suffix(prefs, identifier):
         # Hack. prefs.get('box_shape') does not work before the value is once changed.
-        if identifier == 'box_shape':
-            return prefs.box_shape
-        elif identifier == 'sphere_shape':
-            return prefs.sphere_shape
-        elif identifier == 'capsule_shape':
-            return prefs.capsule_shape
-        elif identifier == 'convex_shape':
-            return prefs.convex_shape
-        else:  # identifier == 'mesh_shape':
-            return prefs.mesh_shape
+        # The preferences use the shape identifiers as property names.
+        if identifier not in SHAPE_NAMES:
+            identifier = 'mesh_shape'
+        return getattr(prefs, identifier)
 
     @staticmethod
     def force_redraw():
-        """Hack to redraw UI"""
-        bpy.context.space_data.overlay.show_text = not bpy.context.space_data.overlay.show_text
-        bpy.context.space_data.overlay.show_text = not bpy.context.space_data.overlay.show_text
-        pass
-
-    def set_collisions_wire_preview(self, mode):
-        """Show wireframe for colliders"""
-        if mode in ['PREVIEW', 'ALWAYS']:
-            for obj in self.new_colliders_list:
-                obj.show_wire = True
-        else:
-            for obj in self.new_colliders_list:
-                obj.show_wire = False
+        """Redraw the 3D viewport to update the overlay"""
+        area = bpy.context.area
+        if area is not None and area.type == 'VIEW_3D':
+            area.tag_redraw()
+            return
+
+        for area in bpy.context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
 
     @staticmethod
     def remove_objects(list):
         """Remove list of objects"""
-        if len(list) > 0:
-            for ob in list:
-                if ob:
-                    objs = bpy.data.objects
+        ids = [ob for ob in list if ob]
+        if len(ids) > 0:
+            try:
+                # unlink and remove all objects in a single pass
+                bpy.data.batch_remove(ids)
+            except:
+                # fall back to removing the objects one by one if some of them are no longer valid
+                objs = bpy.data.objects
+                for ob in ids:
                     try:
                         objs.remove(ob, do_unlink=True)
                     except:
                         pass
 
+    def release_colliders(self, colliders):
+        """Unlink the colliders of the previous generation and keep them for reuse instead of deleting them"""
+        for obj in colliders:
+            try:
+                for col in obj.users_collection:
+                    col.objects.unlink(obj)
+            except ReferenceError:
+                # the object has already been removed, e.g. by joining the colliders
+                continue
+
+            obj.parent = None
+            obj.modifiers.clear()
+            # free the collider name for the next generation
+            obj.name = 'pooled_collider'
+            self.collider_pool.append(obj)
+
+    def new_collider_object(self, name, mesh):
+        """Return a new unlinked object for the mesh. Released colliders are reused if available."""
+        if not self.collider_pool:
+            return bpy.data.objects.new(name, mesh)
+
+        obj = self.collider_pool.pop()
+        old_mesh = obj.data
+        obj.data = mesh
+        if old_mesh.users == 0:
+            bpy.data.meshes.remove(old_mesh)
+
+        obj.name = name
+        obj.matrix_parent_inverse.identity()
+        obj.matrix_world = Matrix()
+        return obj
+
+    def remove_collider_pool(self):
+        """Delete the released colliders that were not reused and their meshes"""
+        meshes = [obj.data for obj in self.collider_pool]
+        self.remove_objects(self.collider_pool)
+        self.collider_pool = []
+
+        meshes = [me for me in meshes if me.users == 0]
+        if meshes:
+            bpy.data.batch_remove(meshes)
+
     @staticmethod
     def get_delta_value(delta, event, sensibility=0.05, tweak_amount=10, round_precision=0):
         """Get delta of input movement"""
@@ -689,9 +762,8 @@ class OBJECT_OT_add_bounding_object():
             bm.from_object(obj, depsgraph)
 
         else:  # use_modifiers == False
-            # Get a BMesh representation
-            me.update()  # update mesh data. This is needed to get the current mesh data after editing the mesh (
-            # adding, deleting, transforming)
+            # Get a BMesh representation. The edit mesh is the current data, so the mesh doesn't need an update.
+            # The copy keeps all custom data layers (UVs, vertex groups, seams, creases...) of the edit mesh.
             bm_orig = bmesh.from_edit_mesh(me)
             bm = bm_orig.copy()
 
@@ -708,8 +780,9 @@ class OBJECT_OT_add_bounding_object():
 
     @staticmethod
     def get_edit_mode_vertices_local_space(obj, use_modifiers=False):
-        """ Get vertices from the bmesh. Returns a list of all or selected vertices. Returns None if there are no
-        vertices to return"""
+        """ Get vertices from the bmesh. Returns a list of all or selected vertices. With modifiers, the local coordinates
+        of the selected vertices are returned as (N, 3) numpy array instead. Returns None if there are no vertices to
+        return"""
         me = obj.data
 
         # len(obj.modifiers) has to be bigger than 0. If there are no modifiers are assigned to the object the simple mesh can be used.
@@ -724,21 +797,30 @@ class OBJECT_OT_add_bounding_object():
 
             me.update()  # update mesh data. This is needed to get the current mesh data after editing the mesh (adding, deleting, transforming)
             depsgraph = bpy.context.evaluated_depsgraph_get()
-            bm = bmesh.new()
-            bm.from_object(obj, depsgraph)
-            bm.verts.ensure_lookup_table()
+            # The evaluated mesh can be read directly instead of copying it into a BMesh. The coordinates are copied
+            # before the temporary mesh is freed again, so no references into it are returned.
+            obj_eval = obj.evaluated_get(depsgraph)
+            vertices = obj_eval.to_mesh().vertices
+
+            select = numpy.empty(len(vertices), dtype=bool)
+            vertices.foreach_get('select', select)
+            co = numpy.empty(len(vertices) * 3, dtype=numpy.float32)
+            vertices.foreach_get('co', co)
+            obj_eval.to_mesh_clear()
+
+            used_vertices = co.reshape(-1, 3)[select]
 
         else:  # use_modifiers == False
-            # Get a BMesh representation
-            me.update()  # update mesh data. This is needed to get the current mesh data after editing the mesh (adding, deleting, transforming)
+            # Get a BMesh representation. The edit mesh is the current data, so the mesh doesn't need an update.
             bm = bmesh.from_edit_mesh(me)
+            used_vertices = [v for v in bm.verts if v.select]
+
+            # This is needed for the bmesh not bo be destroyed, even if the variable isn't used later.
+            OBJECT_OT_add_bounding_object.bmesh(bm)
 
-        used_vertices = [v for v in bm.verts if v.select]
         if len(used_vertices) == 0:
             return None
 
-        # This is needed for the bmesh not bo be destroyed, even if the variable isn't used later.
-        OBJECT_OT_add_bounding_object.bmesh(bm)
         return used_vertices
 
     @staticmethod
@@ -746,21 +828,16 @@ class OBJECT_OT_add_bounding_object():
         """ Get vertices from the bmesh. Returns a list of all or selected vertices. Returns None if there are no vertices to return """
         # bpy.ops.object.mode_set(mode='EDIT')
         me = obj.data
-        me.update()  # update mesh data. This is needed to get the current mesh data after editing the mesh (adding, deleting, transforming)
 
         if use_modifiers and len(obj.modifiers) > 0:
             # Get mesh information with the modifiers applied
+            me.update()  # update mesh data. This is needed to get the current mesh data after editing the mesh (adding, deleting, transforming)
             depsgraph = bpy.context.evaluated_depsgraph_get()
-            bm = bmesh.new()
-            bm.from_object(obj, depsgraph)
-            bm.verts.ensure_lookup_table()
-            used_vertices = bm.verts
-
-            # This is needed for the bmesh not bo be destroyed, even if the variable isn't used later.
-            OBJECT_OT_add_bounding_object.bmesh(bm)
+            # The vertices of the evaluated mesh support foreach_get and don't need a BMesh copy. They are only valid
+            # until the depsgraph is evaluated again and have to be read right away.
+            used_vertices = obj.evaluated_get(depsgraph).data.vertices
 
         else:
-            # Get a BMesh representation
             used_vertices = me.vertices
 
         if len(used_vertices) == 0:
@@ -770,39 +847,44 @@ class OBJECT_OT_add_bounding_object():
 
     @staticmethod
     def transform_vertex_space(vertex_co, obj):
-        # iterate over vertex coordinates to transform the positions to the appropriate space
-        ws_vertex_co = []
-        for i in range(len(vertex_co)):
-            co = vertex_co[i]
-            ws_vertex_co.append(obj.matrix_world.inverted() @ co)
+        # transform all vertex coordinates to the appropriate space with a single matrix multiplication
+        co = numpy.asarray(vertex_co, dtype=numpy.float64).reshape(-1, 3)
+        co = transform_coordinates(co, obj.matrix_world.inverted())
 
-        return ws_vertex_co
+        # callers concatenate the result with other coordinate lists
+        return [Vector(v) for v in co.tolist()]
 
     @staticmethod
-    def get_vertex_coordinates(obj, space, used_vertices):
-        """ returns vertex and face information for the bounding box based on the given coordinate space (e.g., world or local)"""
-
-        # Modify the BMesh, can do anything here...
-        co = []
+    def get_vertex_coordinates_array(obj, space, used_vertices, dtype=numpy.float64):
+        """ returns the vertex coordinates as (N, 3) numpy array based on the given coordinate space (e.g., world or local).
+        float32 matches the precision Blender stores the coordinates in and doesn't need a conversion."""
+
+        if isinstance(used_vertices, numpy.ndarray):
+            # coordinates that were already copied from the evaluated mesh
+            co = used_vertices.astype(dtype)
+        elif hasattr(used_vertices, 'foreach_get'):
+            # mesh vertices can be copied in bulk
+            co = numpy.empty(len(used_vertices) * 3, dtype=dtype)
+            used_vertices.foreach_get('co', co)
+            co = co.reshape(-1, 3)
+        else:  # bmesh vertices
+            co = numpy.array([v.co for v in used_vertices], dtype=dtype).reshape(-1, 3)
 
         if space == 'GLOBAL':
-            # get world space coordinates of the vertices
-            for v in used_vertices:
-                v_local = v
-                v_global = obj.matrix_world @ v_local.co
-
-                co.append(v_global)
-
-        else:  # space == 'LOCAL'
-            for v in used_vertices:
-                co.append(v.co)
+            # get world space coordinates of all vertices with a single matrix multiplication
+            co = transform_coordinates(co, obj.matrix_world)
 
         return co
 
+    @staticmethod
+    def get_vertex_coordinates(obj, space, used_vertices):
+        """ returns vertex and face information for the bounding box based on the given coordinate space (e.g., world or local)"""
+        co = OBJECT_OT_add_bounding_object.get_vertex_coordinates_array(obj, space, used_vertices)
+        return [Vector(v) for v in co.tolist()]
+
     @staticmethod
     def mesh_from_selection(obj, use_modifiers=False):
         mesh = obj.data.copy()
-        mesh.update()  # update mesh data. This is needed to get the current mesh data after editing the mesh (adding, deleting, transforming)
 
         bm = bmesh.new()
 
@@ -864,33 +946,37 @@ class OBJECT_OT_add_bounding_object():
     @staticmethod
     def set_collections(obj, collections):
         """link an object to a collection"""
-        old_collection = obj.users_collection
+        old_collections = set(obj.users_collection)
+        new_collections = set(collections)
 
-        for col in collections:
-            try:
-                col.objects.link(obj)
-            except RuntimeError:
-                pass
+        for col in new_collections - old_collections:
+            col.objects.link(obj)
 
-        for col in old_collection:
-            if col not in collections:
-                col.objects.unlink(obj)
+        for col in old_collections - new_collections:
+            col.objects.unlink(obj)
 
     # Modifiers
     @staticmethod
     def apply_all_modifiers(context, obj):
         """apply all modifiers to an object"""
-        context.view_layer.objects.active = obj
-        for mod in obj.modifiers:
-            bpy.ops.object.modifier_apply(modifier=mod.name)
+        if len(obj.modifiers) == 0:
+            return
+
+        # evaluate the whole modifier stack at once and replace the mesh with the result
+        depsgraph = context.evaluated_depsgraph_get()
+        new_mesh = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph))
+        old_mesh = obj.data
+        obj.modifiers.clear()
+        obj.data = new_mesh
+
+        if old_mesh.users == 0:
+            bpy.data.meshes.remove(old_mesh)
 
     @staticmethod
     def remove_all_modifiers(context, obj):
         """Remove all modifiers of an object"""
-        context.view_layer.objects.active = obj
         if obj:
-            for mod in obj.modifiers:
-                obj.modifiers.remove(mod)
+            obj.modifiers.clear()
 
     @staticmethod
     def del_displace_modifier(bounding_object):
@@ -967,9 +1053,10 @@ class OBJECT_OT_add_bounding_object():
         self.add_displacement_modifier(context, bounding_object)
         self.set_collections(bounding_object, base_object_collections)
 
-        if self.prefs.use_col_collection:
-            collection_name = self.prefs.col_collection_name
-            self.add_to_collections(bounding_object, collection_name, color=self.prefs.col_collection_color)
+        settings = self.postprocessing_settings
+        if settings['use_col_collection']:
+            collection_name = settings['col_collection_name']
+            self.add_to_collections(bounding_object, collection_name, color=settings['col_collection_color'])
 
         if self.use_remesh:
             self.add_remesh_modifier(context, bounding_object)
@@ -983,16 +1070,19 @@ class OBJECT_OT_add_bounding_object():
             else:
                 self.report({'WARNING'}, 'Update to a newer Blender Version to access all addon features')
 
-        if not self.prefs.use_parent_to:
-            mtx = bounding_object.matrix_world
+        if not settings['use_parent_to'] and bounding_object.parent:
+            # matrix_world is only updated on the next depsgraph evaluation, so calculate it from the parent
+            mtx = bounding_object.parent.matrix_world @ bounding_object.matrix_parent_inverse @ \
+                  bounding_object.matrix_basis
             bounding_object.parent = None
             bounding_object.matrix_world = mtx
 
-        prefs = bpy.context.preferences.addons[base_package].preferences
-        if context.scene.active_physics_material:
-            mat_name = context.scene.active_physics_material.name
-        elif prefs.physics_material_name:
-            mat_name = prefs.physics_material_name
+        # the active physics material is not cached because it is set below when it's missing
+        active_physics_material = context.scene.active_physics_material
+        if active_physics_material:
+            mat_name = active_physics_material.name
+        elif settings['physics_material_name']:
+            mat_name = settings['physics_material_name']
             mat = create_default_material()
             set_active_physics_material(context, mat.name)
         else:
@@ -1022,74 +1112,65 @@ class OBJECT_OT_add_bounding_object():
 
         objs = []
 
-        # Create the bounding geometry, depending on edit or object mode.
-        for base_ob in self.selected_objects:
-
-            # skip if invalid object
-            if not self.is_valid_object(base_ob):
-                continue
-
-            if base_ob and base_ob.type in self.valid_object_types:
-                user_collections = base_ob.users_collection
-                if base_ob.type == 'MESH':
-                    obj = base_ob.copy() if use_mesh_copy else base_ob
-                    obj.data = base_ob.data.copy() if use_mesh_copy else base_ob.data
-                else:
-                    # store initial state for operation cancel
-                    self.original_obj_data.append(self.store_initial_obj_state(base_ob, user_collections))
-                    # convert meshes
-                    obj = self.convert_to_mesh(context, base_ob, use_modifiers=self.my_use_modifier_stack)
-                    if add_to_tmp_meshes:
-                        self.tmp_meshes.append(obj)
-
-                creation_mode = self.creation_mode[
-                    self.creation_mode_idx] if self.obj_mode == 'OBJECT' else self.creation_mode_edit[
-                    self.creation_mode_idx]
+        # Only the objects that can be converted to a mesh are used to create the colliders.
+        # self.selected_objects keeps all selected objects to restore the selection.
+        base_objects = [obj for obj in self.selected_objects if self.is_valid_object(obj)]
 
-                # Temp meshes for Loose islands
-                if self.use_loose_mesh:
+        # Create the bounding geometry, depending on edit or object mode.
+        for base_ob in base_objects:
+            user_collections = base_ob.users_collection
+            if base_ob.type == 'MESH':
+                obj = base_ob.copy() if use_mesh_copy else base_ob
+                obj.data = base_ob.data.copy() if use_mesh_copy else base_ob.data
+            else:
+                # store initial state for operation cancel
+                self.original_obj_data.append(self.store_initial_obj_state(base_ob, user_collections))
+                # convert meshes
+                obj = self.convert_to_mesh(context, base_ob, use_modifiers=self.my_use_modifier_stack)
+                if add_to_tmp_meshes:
+                    self.tmp_meshes.append(obj)
 
-                    base = obj
+            # Temp meshes for Loose islands
+            if self.use_loose_mesh:
 
-                    bpy.context.view_layer.objects.active = obj
-                    # bpy.ops.object.mode_set(mode='OBJECT')
+                base = obj
 
-                    tmp_ob = obj.copy()
-                    tmp_ob.data = obj.data.copy()
-                    col = self.add_to_collections(tmp_ob, 'tmp_mesh', hide=False,
-                                                  color=self.prefs.col_tmp_collection_color)
+                tmp_ob = obj.copy()
+                tmp_ob.data = obj.data.copy()
+                col = self.add_to_collections(tmp_ob, 'tmp_mesh', hide=False,
+                                              color=self.prefs.col_tmp_collection_color)
 
-                    if self.obj_mode == 'EDIT':
-                        tmp_ob = delete_non_selected_verts(tmp_ob)
+                if self.obj_mode == 'EDIT':
+                    tmp_ob = delete_non_selected_verts(tmp_ob)
 
-                    self.apply_all_modifiers(context, tmp_ob)
-                    base = tmp_ob
+                self.apply_all_modifiers(context, tmp_ob)
+                base = tmp_ob
 
-                    self.tmp_meshes.append(tmp_ob)
+                self.tmp_meshes.append(tmp_ob)
 
-                    if use_local and self.my_space == 'LOCAL':
-                        split_objs = create_objs_from_island(base, use_world=local_world_spc)
-                    else:
-                        split_objs = create_objs_from_island(base, use_world=default_world_spc)
+                if use_local and self.my_space == 'LOCAL':
+                    split_objs = create_objs_from_island(base, use_world=local_world_spc)
+                else:
+                    split_objs = create_objs_from_island(base, use_world=default_world_spc)
 
-                    for split in split_objs:
-                        col = self.add_to_collections(split, 'tmp_mesh', hide=False,
-                                                      color=self.prefs.col_tmp_collection_color)
-                        col.color_tag = self.prefs.col_tmp_collection_color
+                for split in split_objs:
+                    col = self.add_to_collections(split, 'tmp_mesh', hide=False,
+                                                  color=self.prefs.col_tmp_collection_color)
+                    col.color_tag = self.prefs.col_tmp_collection_color
 
-                        for mat in base_ob.material_slots:
-                            set_material(split, mat.material)
+                    for mat in base_ob.material_slots:
+                        set_material(split, mat.material)
 
-                        objs.append((base_ob, split))
+                    objs.append((base_ob, split))
 
-                    if add_to_tmp_meshes:
-                        self.tmp_meshes.extend(split_objs)
+                if add_to_tmp_meshes:
+                    self.tmp_meshes.extend(split_objs)
 
-                    if self.use_modifier_stack and self.my_use_modifier_stack:
-                        list = [tmp_ob]
-                        self.remove_objects(list)
-                else:
-                    objs.append((base_ob, obj))
+                if self.use_modifier_stack and self.my_use_modifier_stack:
+                    list = [tmp_ob]
+                    self.remove_objects(list)
+            else:
+                objs.append((base_ob, obj))
 
         return objs
 
@@ -1134,12 +1215,18 @@ class OBJECT_OT_add_bounding_object():
             self.set_data_name(obj, new_name, self.data_suffix)
 
     def reset_to_initial_state(self, context):
-        for obj in bpy.data.objects:
-            obj.select_set(False)
+        # only the currently selected objects need to be checked instead of all objects in the file
+        initial_selection = set(self.selected_objects)
+        for obj in context.selected_objects:
+            if obj not in initial_selection:
+                obj.select_set(False)
         for obj in self.selected_objects:
-            obj.select_set(True)
+            if not obj.select_get():
+                obj.select_set(True)
         context.view_layer.objects.active = self.active_obj
-        bpy.ops.object.mode_set(mode=self.obj_mode)
+        # mode_set is an operator call, skip it when the active object is already in the initial mode
+        if self.active_obj.mode != self.obj_mode:
+            bpy.ops.object.mode_set(mode=self.obj_mode)
 
     def add_displacement_modifier(self, context, bounding_object):
         # add displacement modifier and safe it to manipulate the strength in the modal operator
@@ -1159,7 +1246,8 @@ class OBJECT_OT_add_bounding_object():
         # add decimation modifier and safe it to manipulate the strength in the modal operator
         modifier = bounding_object.modifiers.new(name="Collision_decimate", type='DECIMATE')
         modifier.ratio = self.current_settings_dic['decimate']
-        self.decimate_modifiers.append(modifier)
+        # modifiers are stored by name, references to them don't stay valid
+        self.decimate_modifiers.append((bounding_object, modifier.name))
 
     @staticmethod
     def add_geo_nodes_hull(bounding_object):
@@ -1193,11 +1281,9 @@ class OBJECT_OT_add_bounding_object():
     def cancel_cleanup(self, context, delete_colliders=True):
         if delete_colliders:
             # Remove previously created collisions
-            if self.new_colliders_list:
-                for obj in self.new_colliders_list:
-                    if obj:
-                        objs = bpy.data.objects
-                        objs.remove(obj, do_unlink=True)
+            self.remove_objects(self.new_colliders_list)
+
+        self.remove_collider_pool()
 
         # Delete temporary objects
         if self.prefs.debug == False:
@@ -1205,6 +1291,7 @@ class OBJECT_OT_add_bounding_object():
             self.remove_empty_collection('tmp_mesh')
 
         self.reset_display(context)
+        self.remove_regeneration_timer(context)
 
         try:
             bpy.types.SpaceView3D.draw_handler_remove(self._handle, 'WINDOW')
@@ -1277,17 +1364,49 @@ class OBJECT_OT_add_bounding_object():
         self.use_recenter_origin = False
         self.use_custom_rotation = False
 
+        # colliders of the previous generation are kept for reuse by new_collider_object
+        self.use_collider_pool = False
+
         self.valid_object_types = ['MESH', 'CURVE', 'SURFACE', 'FONT', 'META']
 
         self.collision_group_idx = 0
 
+        # collider names without the unique number
+        self.collider_name_cache = {}
+
     @classmethod
     def poll(cls, context):
-        count = 0
         for obj in context.selected_objects:
             if obj.type in ['MESH', 'CURVE', 'SURFACE', 'FONT', 'META']:
-                count = count + 1
-        return count > 0
+                return True
+        return False
+
+    def regenerate_colliders(self, context):
+        """Regenerate the colliders. Changes faster than the REGENERATION_INTERVAL are applied by the modal timer."""
+        if self.current_settings_dic == self.applied_settings_dic:
+            # the value was changed back to the one the colliders were generated with
+            self.regeneration_pending = False
+            return
+
+        if time.time() - self.prev_regeneration_time < REGENERATION_INTERVAL:
+            self.regeneration_pending = True
+            return
+
+        self.regeneration_pending = False
+        self.execute(context)
+        self.prev_regeneration_time = time.time()
+
+    def apply_pending_regeneration(self, context):
+        """Regenerate the colliders if the last change has not been applied yet"""
+        if self.regeneration_pending and self.current_settings_dic != self.applied_settings_dic:
+            self.regeneration_pending = False
+            self.execute(context)
+            self.prev_regeneration_time = time.time()
+
+    def remove_regeneration_timer(self, context):
+        if self._timer is not None:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
 
     def set_modal_state(self, cylinder_segments_active=False, displace_active=False, decimate_active=False,
                         opacity_active=False, sphere_segments_active=False, capsule_segments_active=False,
@@ -1328,6 +1447,11 @@ class OBJECT_OT_add_bounding_object():
         self.active_obj = context.view_layer.objects.active
         self.obj_mode = context.object.mode
         self.prev_decimate_time = time.time()
+        self.prev_regeneration_time = 0.0
+        self.regeneration_pending = False
+        # settings used by the last execute
+        self.applied_settings_dic = None
+        self._timer = None
         self.data_suffix = "_data"
         self.valid_input_selection = True
 
@@ -1337,6 +1461,8 @@ class OBJECT_OT_add_bounding_object():
 
         # General init settings
         self.new_colliders_list = []
+        # colliders of the previous generation that can be reused
+        self.collider_pool = []
         self.tmp_meshes = []
         self.col_rotation_matrix_list = []
         self.col_center_loc_list = []
@@ -1346,6 +1472,7 @@ class OBJECT_OT_add_bounding_object():
         # Mouse
         self.mouse_initial_x = event.mouse_x
         self.mouse_position = [event.mouse_x, event.mouse_y]
+        self.prev_segments_mouse_x = event.mouse_x
         self.my_space = colSettings.default_space
 
         # Decimate face count display
@@ -1441,6 +1568,8 @@ class OBJECT_OT_add_bounding_object():
 
         # add modal handler
         context.window_manager.modal_handler_add(self)
+        # the timer applies parameter changes that were throttled while moving the mouse
+        self._timer = context.window_manager.event_timer_add(REGENERATION_INTERVAL, window=context.window)
 
         # stored for decimate display
         self.mouse_path = []
@@ -1448,6 +1577,11 @@ class OBJECT_OT_add_bounding_object():
         self.execute(context)
 
     def modal(self, context, event):
+        if event.type == 'TIMER':
+            if time.time() - self.prev_regeneration_time >= REGENERATION_INTERVAL:
+                self.apply_pending_regeneration(context)
+            return {'RUNNING_MODAL'}
+
         colSettings = context.scene.simple_collider
 
         self.navigation = False
@@ -1482,6 +1616,9 @@ class OBJECT_OT_add_bounding_object():
 
         # apply operator
         elif event.type in {'LEFTMOUSE', 'NUMPAD_ENTER', 'RET'}:
+            self.apply_pending_regeneration(context)
+            self.remove_regeneration_timer(context)
+
             if bpy.context.space_data.shading.color_type:
                 context.space_data.shading.color_type = self.color_type
 
@@ -1525,6 +1662,8 @@ class OBJECT_OT_add_bounding_object():
                 self.remove_objects(self.tmp_meshes)
                 self.remove_empty_collection('tmp_mesh')
 
+            self.remove_collider_pool()
+
             try:
                 bpy.types.SpaceView3D.draw_handler_remove(self._handle, 'WINDOW')
             except ValueError:
@@ -1565,8 +1704,8 @@ class OBJECT_OT_add_bounding_object():
         elif event.type == 'C' and event.value == 'RELEASE':
             self.x_ray = not self.x_ray
             context.space_data.shading.show_xray = self.x_ray
-            # Another function needs to be called for the modal UI to update :(
-            self.set_collisions_wire_preview(self.prefs.wireframe_mode)
+            # the wireframe state of the colliders is already set, only the viewport has to be redrawn
+            self.force_redraw()
 
         elif event.type == 'J' and event.value == 'RELEASE':
             self.join_primitives = not self.join_primitives
@@ -1659,11 +1798,13 @@ class OBJECT_OT_add_bounding_object():
         elif event.type == 'T' and event.value == 'RELEASE' and self.collider_groups_enabled:
             # toggle through display modes
             self.collision_group_idx = (self.collision_group_idx + 1) % len(self.collision_groups)
+            col = self.collision_groups[self.collision_group_idx].color
+            color = (col[0], col[1], col[2], self.current_settings_dic['alpha'])
             for obj in self.new_colliders_list:
-                col = self.collision_groups[self.collision_group_idx].color
-                set_object_color(obj, (col[0], col[1], col[2], self.current_settings_dic['alpha']))
+                set_object_color(obj, color)
                 self.set_object_collider_group(obj)
-                self.update_names()
+            # update_names renames all colliders at once
+            self.update_names()
 
         elif event.type == 'MOUSEMOVE':
             # calculate mouse movement and offset camera
@@ -1675,6 +1816,12 @@ class OBJECT_OT_add_bounding_object():
                 self.ignore_input = True
                 return {'RUNNING_MODAL'}
 
+            # segment counts only change every few pixels, smaller movements can be ignored
+            if self.cylinder_segments_active or self.sphere_segments_active or self.capsule_segments_active:
+                if abs(event.mouse_x - self.prev_segments_mouse_x) < SEGMENTS_MOUSE_THRESHOLD:
+                    return {'RUNNING_MODAL'}
+                self.prev_segments_mouse_x = event.mouse_x
+
             if self.displace_active:
                 offset = self.get_delta_value(delta, event, sensibility=0.002, tweak_amount=10, round_precision=1)
                 strength = self.ref_settings_dic['displace_offset'] - offset
@@ -1689,30 +1836,32 @@ class OBJECT_OT_add_bounding_object():
             if self.decimate_active:
                 delta = self.get_delta_value(delta, event, sensibility=0.002, tweak_amount=10, round_precision=1)
                 dec_amount = (self.ref_settings_dic['decimate'] + delta)
-                dec_amount = numpy.clip(dec_amount, 0.01, 1.0)
+                dec_amount = min(max(dec_amount, 0.01), 1.0)
 
                 if self.current_settings_dic['decimate'] != dec_amount:
                     self.current_settings_dic['decimate'] = dec_amount
-                    # I had to iterate over all object because it crashed when just iterating over the modifiers.
-
                     self.face_counts = []
 
-                    for obj in self.new_colliders_list:
-
-                        for mod in obj.modifiers:
-                            if mod in self.decimate_modifiers:
-                                mod.ratio = dec_amount
-                                face_count = mod.face_count
-                                self.face_counts.append(face_count)
-
-                                ## More accurate but less efficient face calculation
-                                # bmesh for getting triangle data
-                                # bm=bmesh.new()
-                                # depsgraph = bpy.context.evaluated_depsgraph_get()
-                                # bm.from_object(obj, depsgraph)
-                                # face_count = len(bm.faces)
-                                # self.polycount.append(str(face_count))
-                                # bm.free()
+                    for obj, mod_name in self.decimate_modifiers:
+                        try:
+                            mod = obj.modifiers.get(mod_name)
+                        except ReferenceError:
+                            # the collider has been joined into another collider
+                            continue
+
+                        if mod:
+                            mod.ratio = dec_amount
+                            face_count = mod.face_count
+                            self.face_counts.append(face_count)
+
+                            ## More accurate but less efficient face calculation
+                            # bmesh for getting triangle data
+                            # bm=bmesh.new()
+                            # depsgraph = bpy.context.evaluated_depsgraph_get()
+                            # bm.from_object(obj, depsgraph)
+                            # face_count = len(bm.faces)
+                            # self.polycount.append(str(face_count))
+                            # bm.free()
 
                     self.report({'INFO'}, "Total collider face count:" + str(sum(self.face_counts)))
                     self.draw_callback_px(context)
@@ -1720,7 +1869,7 @@ class OBJECT_OT_add_bounding_object():
             if self.remesh_active:
                 delta = self.get_delta_value(delta, event, sensibility=0.002, tweak_amount=10, round_precision=1)
                 voxel_size = (self.ref_settings_dic['voxel_size'] + delta)
-                voxel_size = numpy.clip(voxel_size, 0.01, 1.0)
+                voxel_size = min(max(voxel_size, 0.01), 1.0)
 
                 if self.current_settings_dic['voxel_size'] != voxel_size:
                     self.current_settings_dic['voxel_size'] = voxel_size
@@ -1731,7 +1880,7 @@ class OBJECT_OT_add_bounding_object():
             if self.opacity_active:
                 delta = self.get_delta_value(delta, event, sensibility=0.002, tweak_amount=10, round_precision=1)
                 color_alpha = self.ref_settings_dic['alpha'] - delta
-                color_alpha = numpy.clip(color_alpha, 0.00, 1.0)
+                color_alpha = min(max(color_alpha, 0.00), 1.0)
 
                 for obj in self.new_colliders_list:
                     obj.color[3] = color_alpha
@@ -1747,37 +1896,38 @@ class OBJECT_OT_add_bounding_object():
                 if segment_count != int(round(self.current_settings_dic['cylinder_segments'])):
                     segment_count = 3 if segment_count < 3 else segment_count
                     self.current_settings_dic['cylinder_segments'] = segment_count
-                    self.execute(context)
+                    self.regenerate_colliders(context)
 
             if self.height_active:
                 # delta = self.get_delta_value(delta, event, sensibility=0.002, tweak_amount=10, round_precision=1)
                 offset = self.get_delta_value(delta, event, sensibility=0.002, tweak_amount=10, round_precision=1)
                 strength = self.ref_settings_dic['height_mult'] - offset
                 height_mult = strength
-                height_mult = numpy.clip(height_mult, 0, 10.0)
+                height_mult = min(max(height_mult, 0.0), 10.0)
 
                 if self.current_settings_dic['height_mult'] != height_mult:
                     self.current_settings_dic['height_mult'] = height_mult
-                    self.execute(context)
+                    self.regenerate_colliders(context)
 
             if self.width_active:
                 offset = self.get_delta_value(delta, event, sensibility=0.002, tweak_amount=10, round_precision=1)
                 strength = self.ref_settings_dic['width_mult'] - offset
                 width_mult = strength
-                width_mult = numpy.clip(width_mult, 0, 10.0)
+                width_mult = min(max(width_mult, 0.0), 10.0)
 
                 if self.current_settings_dic['width_mult'] != width_mult:
                     self.current_settings_dic['width_mult'] = width_mult
-                    self.execute(context)
+                    self.regenerate_colliders(context)
 
             if self.sphere_segments_active:
                 delta = self.get_delta_value(delta, event, sensibility=0.02, tweak_amount=10)
                 segments = int(abs(self.ref_settings_dic['sphere_segments'] - delta))
+                segments = max(segments, 3)
 
                 # check if value changed to avoid regenerating collisions for the same value
                 if segments != int(round(self.current_settings_dic['sphere_segments'])):
                     self.current_settings_dic['sphere_segments'] = segments
-                    self.execute(context)
+                    self.regenerate_colliders(context)
 
             if self.capsule_segments_active:
                 delta = self.get_delta_value(delta, event, sensibility=0.02, tweak_amount=10)
@@ -1786,7 +1936,7 @@ class OBJECT_OT_add_bounding_object():
                 # check if value changed to avoid regenerating collisions for the same value
                 if segments != int(round(self.current_settings_dic['capsule_segments'])):
                     self.current_settings_dic['capsule_segments'] = segments
-                    self.execute(context)
+                    self.regenerate_colliders(context)
 
         # passthrough specific events to blenders default behavior
         elif event.type in {'WHEELUPMOUSE', 'WHEELDOWNMOUSE'}:
@@ -1811,10 +1961,18 @@ class OBJECT_OT_add_bounding_object():
         if not colSettings.get('visibility_toggle_user_group_01'):
             set_default_group_values()
 
+        self.applied_settings_dic = self.current_settings_dic.copy()
+
         # Remove objects from previous generation
         self.remove_objects(self.tmp_meshes)
 
-        self.remove_objects(self.new_colliders_list)
+        # colliders released by the previous call and not reused are deleted, so only one generation is kept
+        self.remove_collider_pool()
+        if self.use_collider_pool:
+            self.release_colliders(self.new_colliders_list)
+        else:
+            # shapes that don't create their colliders with new_collider_object would never reuse them
+            self.remove_objects(self.new_colliders_list)
         self.remove_empty_collection('tmp_mesh')
         self.new_colliders_list = []
         self.original_obj_data = []
@@ -1826,6 +1984,14 @@ class OBJECT_OT_add_bounding_object():
         # reset previously stored displace modifiers when creating a new object
         self.displace_modifiers = []
         self.remesh_modifiers = []
+        self.decimate_modifiers = []
 
-        # Create the bounding geometry, depending on edit or object mode.
-        self.old_objs = set(context.scene.objects)
+        # store the preferences used for every generated collider
+        prefs = self.prefs
+        self.postprocessing_settings = {
+            'use_col_collection': prefs.use_col_collection,
+            'col_collection_name': prefs.col_collection_name,
+            'col_collection_color': prefs.col_collection_color,
+            'use_parent_to': prefs.use_parent_to,
+            'physics_material_name': prefs.physics_material_name,
+        }
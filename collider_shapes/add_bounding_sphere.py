@@ -1,5 +1,5 @@
-import bmesh
 import bpy
+import numpy as np
 from bpy.types import Operator
 from mathutils import Vector
 
@@ -7,22 +7,185 @@ from .add_bounding_primitive import OBJECT_OT_add_bounding_object
 
 tmp_sphere_name = 'sphere_collider'
 
+# normalized cardinal and diagonal directions used to find distant point pairs for the initial sphere
+EXTREMAL_AXES = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1],
+                          [1, 1, 1], [1, 1, -1], [1, -1, 1], [-1, 1, 1]], dtype=np.float64)
+EXTREMAL_AXES /= np.linalg.norm(EXTREMAL_AXES, axis=1)[:, np.newaxis]
+EXTREMAL_AXES.flags.writeable = False
 
-def distance_vec(point1: Vector, point2: Vector):
-    """Calculate distance between two points."""
-    return (point2 - point1).length
 
+def circumsphere(points):
+    """Return center and radius of the smallest sphere with all 1 to 4 points on its surface or None if the points
+    are degenerate (e.g. collinear or coplanar)."""
+    p0 = points[0]
+
+    if len(points) == 1:
+        return p0, 0.0
+
+    if len(points) == 2:
+        center = (p0 + points[1]) * 0.5
+        return center, float(np.linalg.norm(points[1] - center))
 
-def midpoint(p1, p2):
-    return (p1 + p2) * 0.5
+    if len(points) == 3:
+        # circumcenter of the triangle in its plane
+        a = points[1] - p0
+        b = points[2] - p0
+        axb = np.cross(a, b)
+        denominator = 2.0 * axb.dot(axb)
+        if denominator < 1e-18:
+            return None
+        center = p0 + (a.dot(a) * np.cross(b, axb) + b.dot(b) * np.cross(axb, a)) / denominator
+        return center, float(np.linalg.norm(p0 - center))
+
+    # circumcenter of the tetrahedron
+    a = 2.0 * (points[1:] - p0)
+    b = (points[1:] * points[1:]).sum(axis=1) - p0.dot(p0)
+    try:
+        center = np.linalg.solve(a, b)
+    except np.linalg.LinAlgError:
+        return None
+    return center, float(np.linalg.norm(p0 - center))
+
+
+def small_enclosing_sphere(co):
+    """Return center and radius of the exact minimum enclosing sphere of up to 4 points by testing the spheres of all
+    point combinations."""
+    best = None
+
+    for mask in range(1, 1 << len(co)):
+        sphere = circumsphere(co[[i for i in range(len(co)) if mask & (1 << i)]])
+        if sphere is None:
+            continue
+
+        center, radius = sphere
+        if best is not None and radius >= best[1]:
+            continue
+
+        if np.linalg.norm(co - center, axis=1).max() <= radius * (1.0 + 1e-9) + 1e-12:
+            best = sphere
+
+    return best
+
+
+def minimal_sphere_with_point(support, point):
+    """Return center, radius and support points of the minimal sphere enclosing the support points and the new
+    point. The new point lies outside the sphere of the support, so it has to be on the surface of the new sphere."""
+    points = np.vstack((support, point))
+    best = None
+
+    # brute force all combinations of the new point with up to 3 support points
+    for mask in range(1 << len(support)):
+        subset = [i for i in range(len(support)) if mask & (1 << i)]
+        if len(subset) > 3:
+            continue
+
+        sphere = circumsphere(np.vstack((support[subset], point)))
+        if sphere is None:
+            continue
+
+        center, radius = sphere
+        if best is not None and radius >= best[1]:
+            continue
+
+        # the sphere has to contain all points
+        if np.linalg.norm(points - center, axis=1).max() <= radius * (1.0 + 1e-9) + 1e-12:
+            best = (center, radius, np.vstack((support[subset], point)))
+
+    return best
+
+
+def minimum_enclosing_sphere(co, support):
+    """Calculate the exact minimum enclosing sphere of the (N, 3) coordinates by repeatedly adding the farthest point
+    to the set of support points. Every step only needs one vectorized distance pass over all points. The distance
+    passes use the precision of the coordinates, the small sphere calculations are done in double precision."""
+    support = support.astype(np.float64)
+    center, radius = circumsphere(support)
+
+    # rounding error of the distances
+    rounding_tolerance = 8.0 * np.finfo(co.dtype).eps * float(np.abs(co).max())
+
+    # the radius grows every iteration, so the loop ends. The limit only guards against rounding issues.
+    for _ in range(1000):
+        distances = np.linalg.norm(co - center.astype(co.dtype), axis=1)
+        idx = distances.argmax()
+
+        # all points are inside the sphere (with tolerance for rounding errors)
+        if distances[idx] <= radius * (1.0 + 1e-6) + rounding_tolerance:
+            return center, radius
+
+        sphere = minimal_sphere_with_point(support, co[idx])
+        if sphere is None:
+            break
+        center, radius, support = sphere
+
+    # fall back to growing the radius to enclose all points
+    return center, float(np.linalg.norm(co - center.astype(co.dtype), axis=1).max())
+
+
+# unit sphere mesh data for every segment count that was used already
+sphere_template_cache = {}
+
+
+def get_sphere_template(segments):
+    """Return the vertex coordinates, loop vertex indices and loop starts of a UV sphere with radius 1. The data is
+    calculated directly from the sphere parametrization and only created once per segment count."""
+    # a sphere needs at least one ring between the poles
+    segments = max(int(segments), 2)
+
+    if segments in sphere_template_cache:
+        return sphere_template_cache[segments]
+
+    u_segments = segments * 2
+    v_segments = segments
+
+    # vertices: top pole, v_segments - 1 rings from top to bottom and the bottom pole
+    theta = np.linspace(0.0, np.pi, v_segments + 1)[1:-1]
+    phi = np.linspace(0.0, 2.0 * np.pi, u_segments, endpoint=False)
+    rings = np.empty((len(theta), u_segments, 3))
+    rings[..., 0] = np.outer(np.sin(theta), np.cos(phi))
+    rings[..., 1] = np.outer(np.sin(theta), np.sin(phi))
+    rings[..., 2] = np.cos(theta)[:, np.newaxis]
+    co = np.vstack(([0.0, 0.0, 1.0], rings.reshape(-1, 3), [0.0, 0.0, -1.0])).astype(np.float32)
+
+    # ring vertex indices and the index of the next vertex of the same ring
+    ring_idx = 1 + np.arange(len(theta) * u_segments).reshape(len(theta), u_segments)
+    next_idx = np.roll(ring_idx, -1, axis=1)
+    top = 0
+    bottom = len(co) - 1
+
+    # faces ordered counterclockwise seen from the outside
+    top_tris = np.column_stack((np.full(u_segments, top), ring_idx[0], next_idx[0]))
+    quads = np.stack((ring_idx[:-1], ring_idx[1:], next_idx[1:], next_idx[:-1]), axis=-1).reshape(-1, 4)
+    bottom_tris = np.column_stack((ring_idx[-1], np.full(u_segments, bottom), next_idx[-1]))
+
+    loop_vertex_indices = np.concatenate((top_tris.ravel(), quads.ravel(), bottom_tris.ravel())).astype(np.int32)
+    face_sizes = [3] * u_segments + [4] * len(quads) + [3] * u_segments
+    loop_starts = np.cumsum([0] + face_sizes[:-1], dtype=np.int32)
+
+    for array in (co, loop_vertex_indices, loop_starts):
+        array.flags.writeable = False
+
+    sphere_template_cache[segments] = (co, loop_vertex_indices, loop_starts)
+    return sphere_template_cache[segments]
 
 
 def create_sphere(pos, diameter, segments):
     """Create a UV sphere at the given position with the specified diameter and segments."""
     global tmp_sphere_name
 
-    # Create an empty mesh and the object.
+    co, loop_vertex_indices, loop_starts = get_sphere_template(segments)
+
+    # Create the mesh from the cached unit sphere scaled to the radius.
     mesh = bpy.data.meshes.new(tmp_sphere_name)
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set('co', (co * diameter).ravel())
+    mesh.loops.add(len(loop_vertex_indices))
+    mesh.loops.foreach_set('vertex_index', loop_vertex_indices)
+    mesh.polygons.add(len(loop_starts))
+    mesh.polygons.foreach_set('loop_start', loop_starts)
+    mesh.update(calc_edges=True)
+    mesh.shade_smooth()
+
     basic_sphere = bpy.data.objects.new(tmp_sphere_name, mesh)
 
     # Add the object into the scene.
@@ -33,20 +196,6 @@ def create_sphere(pos, diameter, segments):
     basic_sphere.select_set(True)
     basic_sphere.location = pos
 
-    # Construct the bmesh sphere and assign it to the blender mesh.
-    bm = bmesh.new()
-    if bpy.app.version >= (3, 0, 0):
-        bmesh.ops.create_uvsphere(bm, u_segments=segments * 2, v_segments=segments, radius=diameter)
-    else:
-        bmesh.ops.create_uvsphere(bm, u_segments=segments * 2, v_segments=segments, diameter=diameter)
-
-    for f in bm.faces:
-        f.smooth = True
-
-    bm.to_mesh(mesh)
-    mesh.update()
-    bm.clear()
-
     return basic_sphere
 
 
@@ -57,70 +206,32 @@ class OBJECT_OT_add_bounding_sphere(OBJECT_OT_add_bounding_object, Operator):
     bl_description = 'Create spherical colliders based on the selection'
 
     @staticmethod
-    def calculate_bounding_sphere(obj, used_vertices):
-        # Get vertices wit min and may value
-        for i, vertex in enumerate(used_vertices):
-
-            # convert to global space
-            v = obj.matrix_world @ vertex.co
-
-            # ignore 1. point since it's already saved
-            if i == 0:
-                min_x = v
-                max_x = v
-                min_y = v
-                max_y = v
-                min_z = v
-                max_z = v
-
-            # compare points to previous min and max
-            # v.co returns mathutils.Vector
-            else:
-                min_x = v if v.x < min_x.x else min_x
-                max_x = v if v.x > max_x.x else max_x
-                min_y = v if v.y < min_y.y else min_y
-                max_y = v if v.y > max_y.y else max_y
-                min_z = v if v.z < min_z.z else min_z
-                max_z = v if v.z > max_z.z else max_z
-
-        # calculate distances between min and max of every axis
-        dx = distance_vec(min_x, max_x)
-        dy = distance_vec(min_y, max_y)
-        dz = distance_vec(min_z, max_z)
-
-        mid_point = None
-        radius = None
-
-        # Generate sphere for biggest distance
-        if dx >= dy and dx >= dz:
-            mid_point = midpoint(min_x, max_x)
-            radius = dx / 2
-
-        elif dy >= dz:
-            mid_point = midpoint(min_y, max_y)
-            radius = dy / 2
-
-        else:
-            mid_point = midpoint(min_z, max_z)
-            radius = dz / 2
-
-        # second pass
-        for vertex in used_vertices:
-            # convert to global space
-            v = obj.matrix_world @ vertex.co
-
-            # calculate distance to center to find out if the point is in or outside the sphere
-            distance_center_to_v = distance_vec(mid_point, v)
-
-            # point is outside the collision sphere
-            if distance_center_to_v > radius:
-                radius = (radius + distance_center_to_v) / 2
-                old_to_new = distance_center_to_v - radius
-
-                # calculate new_midpoint
-                mid_point = (mid_point * radius + v * old_to_new) / distance_center_to_v
-
-        return mid_point, radius
+    def calculate_bounding_sphere(co):
+        """Calculate mid point and radius of the sphere enclosing the (N, 3) world space coordinates."""
+        # the sphere of a few vertices is solved directly
+        if len(co) <= 4:
+            mid_point, radius = small_enclosing_sphere(co.astype(np.float64))
+            return Vector(mid_point), float(radius)
+
+        # Move the points close to the origin in double precision and use single precision for the distance passes.
+        # float32 coordinates far away from the world origin would lose the precision needed for the comparisons.
+        origin = (co.min(axis=0) + co.max(axis=0)) / 2.0
+        co = (co - origin).astype(np.float32)
+
+        # project the vertices onto all extremal axes and get the vertices with min and max value for every axis
+        projection = co @ EXTREMAL_AXES.T.astype(co.dtype)
+        min_idx = projection.argmin(axis=0)
+        max_idx = projection.argmax(axis=0)
+
+        # use the pair with the biggest distance along its axis
+        axes = np.arange(len(EXTREMAL_AXES))
+        axis = (projection[max_idx, axes] - projection[min_idx, axes]).argmax()
+        seed = (co[min_idx[axis]], co[max_idx[axis]])
+
+        # the extreme points of the biggest distance are the first support points of the exact sphere
+        mid_point, radius = minimum_enclosing_sphere(co, np.array(seed))
+
+        return Vector(mid_point + origin), float(radius)
 
     def __init__(self):
         super().__init__()
@@ -173,10 +284,6 @@ class OBJECT_OT_add_bounding_sphere(OBJECT_OT_add_bounding_object, Operator):
         objs = self.get_pre_processed_mesh_objs(context, default_world_spc=True)
 
         for base_ob, obj in objs:
-            initial_mod_state = {}
-            context.view_layer.objects.active = obj
-            scene = context.scene
-
             if self.obj_mode == "EDIT" and base_ob.type == 'MESH' and self.active_obj.type == 'MESH' and not self.use_loose_mesh:
                 used_vertices = self.get_edit_mode_vertices_local_space(obj, use_modifiers=self.my_use_modifier_stack)
 
@@ -186,24 +293,29 @@ class OBJECT_OT_add_bounding_sphere(OBJECT_OT_add_bounding_object, Operator):
             if used_vertices is None:  # Skip object if there is no Mesh data to create the collider
                 continue
 
-            bounding_sphere_data = {}
+            # get the world space coordinates once, they are used for both the seed and the sphere calculation
+            ws_vtx_co = self.get_vertex_coordinates_array(obj, 'GLOBAL', used_vertices)
 
             creation_mode = self.creation_mode[self.creation_mode_idx] if self.obj_mode == 'OBJECT' else \
                 self.creation_mode_edit[self.creation_mode_idx]
 
             if creation_mode in ['INDIVIDUAL'] or self.use_loose_mesh:
-
-                bounding_sphere_data['mid_point'], bounding_sphere_data['radius'] = self.calculate_bounding_sphere(obj,
-                                                                                                                   used_vertices)
+                bounding_sphere_data = {}
+                bounding_sphere_data['mid_point'], bounding_sphere_data['radius'] = self.calculate_bounding_sphere(
+                    ws_vtx_co)
                 bounding_sphere_data['parent'] = base_ob
                 collider_data.append(bounding_sphere_data)
 
             else:  # if self.creation_mode[self.creation_mode_idx] == 'SELECTION':
-                # get list of all vertex coordinates in global space
-                ws_vtx_co = self.get_vertex_coordinates(obj, 'GLOBAL', used_vertices)
-                verts_co = verts_co + ws_vtx_co
+                # collect the vertex coordinates of all objects in global space
+                verts_co.append(ws_vtx_co)
 
-                collider_data = self.bounding_sphere_data_selection(verts_co)
+        if verts_co:
+            bounding_sphere_data = {}
+            bounding_sphere_data['mid_point'], bounding_sphere_data['radius'] = self.calculate_bounding_sphere(
+                np.concatenate(verts_co))
+            bounding_sphere_data['parent'] = self.active_obj
+            collider_data = [bounding_sphere_data]
 
         for bounding_sphere_data in collider_data:
             mid_point = bounding_sphere_data['mid_point']
@@ -231,20 +343,3 @@ class OBJECT_OT_add_bounding_sphere(OBJECT_OT_add_bounding_object, Operator):
         self.report({'INFO'}, f"Sphere Collider: {float(elapsed_time)}")
 
         return {'RUNNING_MODAL'}
-
-    def bounding_sphere_data_selection(self, verts_co):
-        bounding_sphere_data = {}
-
-        verts_co = self.transform_vertex_space(verts_co, self.active_obj)
-
-        bm = bmesh.new()
-        for v in verts_co:
-            bm.verts.new(v)  # add a new vert
-        me = bpy.data.meshes.new("mesh")
-        bm.to_mesh(me)
-        bm.free()
-
-        bounding_sphere_data['mid_point'], bounding_sphere_data['radius'] = self.calculate_bounding_sphere(
-            self.active_obj, me.vertices)
-        bounding_sphere_data['parent'] = self.active_obj
-        return [bounding_sphere_data]
@@ -3,10 +3,7 @@ from mathutils import Matrix
 
 def get_sca_matrix(scale):
     """get scale matrix"""
-    scale_mx = Matrix()
-    for i in range(3):
-        scale_mx[i][i] = scale[i]
-    return scale_mx
+    return Matrix.Diagonal((scale[0], scale[1], scale[2], 1.0))
 
 
 def get_loc_matrix(location):
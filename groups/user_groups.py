@@ -189,11 +189,10 @@ class COLLISION_OT_assign_user_group(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        count = 0
         for obj in context.selected_objects:
             if obj.type == 'MESH':
-                count += 1
-        return count > 0
+                return True
+        return False
 
     def execute(self, context):
         prefs = context.preferences.addons[base_package].preferences
@@ -10,6 +10,15 @@ from ..groups.user_groups import get_groups_color, get_groups_name, get_groups_i
 
 from .. import __package__ as base_package
 
+# (identifier, text, icon) of the convert shape buttons. Built once instead of on every redraw.
+CONVERT_SHAPE_BUTTONS = (
+    ('box_shape', '', 'MESH_CUBE'),
+    ('sphere_shape', '', 'MESH_UVSPHERE'),
+    ('capsule_shape', '', 'MESH_CAPSULE'),
+    ('convex_shape', '', 'MESH_ICOSPHERE'),
+    ('mesh_shape', '', 'MESH_MONKEY'),
+)
+
 
 # needed for adding direct link to settings
 def get_addon_name():
@@ -230,23 +239,14 @@ def draw_creation_menu(context, layout, settings=False):
     row = layout.row(align=True)
     row.scale_x = 1.0  # Ensure buttons take up the full width
 
-    shapes = [{'identifier': 'box_shape', 'text': '', 'icon': 'MESH_CUBE'},
-              {'identifier': 'sphere_shape', 'text': '', 'icon': 'MESH_UVSPHERE'},
-              {'identifier': 'capsule_shape', 'text': '', 'icon': 'MESH_CAPSULE'},
-              {'identifier': 'convex_shape', 'text': '', 'icon': 'MESH_ICOSPHERE'},
-              {'identifier': 'mesh_shape', 'text': '', 'icon': 'MESH_MONKEY'},
-              ]
-
-    button_amount = len(shapes)
-
     # Use layout.split() to divide the row into equal parts
-    split = layout.split(factor=1.0 / button_amount, align=True)
+    split = layout.split(factor=1.0 / len(CONVERT_SHAPE_BUTTONS), align=True)
 
-    for shape in shapes:
+    for identifier, text, icon in CONVERT_SHAPE_BUTTONS:
         # Create a column for each button
         col = split.column(align=True)
-        op = col.operator('object.assign_collision_shape', text=shape['text'], icon=shape['icon'])
-        op.shape_identifier = shape['identifier']
+        op = col.operator('object.assign_collision_shape', text=text, icon=icon)
+        op.shape_identifier = identifier
 
     row = layout.row(align=True)
     row.label(text='Convert')
@@ -627,11 +627,10 @@ class BUTTON_OT_auto_convex(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        count = 0
         for obj in context.selected_objects:
             if obj.type in ['MESH', 'CURVE', 'SURFACE', 'FONT', 'META']:
-                count = count + 1
-        return count > 0
+                return True
+        return False
 
     def execute(self, context):
         bpy.ops.wm.call_panel(name="POPUP_PT_auto_convex")